@@ -5,23 +5,54 @@
 from flask import Flask, render_template
 from flask_cors import CORS
 from config import Config
+from . import page_cache, serializers, warmup
+from .database import mongo
+from .dispatch import LazyBlueprintDispatcher
+import importlib
 # from flask_sqlalchemy import SQLAlchemy
 # db = SQLAlchemy()
 # db.init_app(app)
 
 
+# Blueprints registered on startup: (routes module, blueprint, url prefix).
+CORE_BLUEPRINTS = [
+    ('.index.routes', 'index_bp', None),
+    ('.resume.routes', 'resume_bp', None),
+    ('.projects.routes', 'projects_bp', None)
+]
+
+# Project blueprints, with path prefixes of their URLs.  With LAZY_BLUEPRINTS,
+# each is loaded on first request under its prefixes, along with its heavy
+# imports (NumPy, google_auth_oauthlib, flask_jwt_extended, requests)
+# and startup loads.
+PROJECT_BLUEPRINTS = [
+    ('.projects.gallery.routes', 'gallery_bp', '/projects',
+        ['/projects/gallery']),
+    ('.projects.tokaido.routes', 'tokaido_bp', '/projects',
+        ['/projects/tokaido-urban-hike']),
+    ('.projects.japan_real_estate_choropleth.routes', 'japan_real_estate_choropleth_bp', '/projects',
+        ['/projects/fudousan-kakaku-nuriwake-chizu-2010-2020']),
+    ('.projects.japan_real_estate_dashboard.routes', 'japan_real_estate_dashboard_bp', '/projects',
+        ['/projects/japan-real-estate-dashboard-2010-2020', '/projects/fudousan-kakaku-hikaku-2010-2020']),
+    ('.projects.photo_diary.routes', 'photo_diary_bp', '/projects',
+        ['/projects/photo-diary'])
+]
+
+
 def error_404(e):
   """ 404 error handler. """
-  return render_template('/error_404/templates/error_404.html', 
+  return render_template('/error_404/templates/error_404.html',
     title="Oops, you're lost!  ——  jeanings.space"), 404
 
 
-def create_app():
-    """ Initiate Flask application factory. """
+def create_base_app():
+    """ Flask app with config and extensions, no blueprints. """
     app = Flask(__name__)
     app.config.from_object(Config)
+    serializers.init_app(app)
+    mongo.init_app(app)
     DEBUG_MODE = app.config['FLASK_DEBUG']
-    
+
     # CORS settings.
     origins = []
     if DEBUG_MODE == False:
@@ -31,29 +62,42 @@ def create_app():
 
     app.config['CORS_ORIGIN'] = origins
     CORS(app, origin=origins, supports_credentials=True)
+    app.register_error_handler(404, error_404)
 
+    return app
 
-    # Import blueprints, routes for application.
+
+def register_blueprints(app, blueprints):
+    """ Import routes modules within app's context, register their blueprints. """
     with app.app_context():
-        from .index import routes as index
-        from .resume import routes as resume
-        from .projects import routes as projects
-        from .projects.gallery import routes as gallery
-        from .projects.tokaido import routes as tokaido
-        from .projects.japan_real_estate_choropleth import routes as japan_real_estate_choropleth
-        from .projects.japan_real_estate_dashboard import routes as japan_real_estate_dashboard
-        from .projects.photo_diary import routes as photo_diary
-
-        # db.create_all()
-
-        app.register_blueprint(index.index_bp)
-        app.register_blueprint(resume.resume_bp)
-        app.register_blueprint(projects.projects_bp)
-        app.register_blueprint(gallery.gallery_bp, url_prefix="/projects")
-        app.register_blueprint(tokaido.tokaido_bp, url_prefix="/projects")
-        app.register_blueprint(japan_real_estate_choropleth.japan_real_estate_choropleth_bp, url_prefix="/projects")
-        app.register_blueprint(japan_real_estate_dashboard.japan_real_estate_dashboard_bp, url_prefix="/projects")
-        app.register_blueprint(photo_diary.photo_diary_bp, url_prefix="/projects")
-        app.register_error_handler(404, error_404)
-
-        return app
+        for module_name, blueprint_name, url_prefix, *prefixes in blueprints:
+            routes = importlib.import_module(module_name, __name__)
+            app.register_blueprint(getattr(routes, blueprint_name), url_prefix=url_prefix)
+
+
+def create_blueprint_app(blueprint):
+    """ App serving a single lazily loaded blueprint. """
+    app = create_base_app()
+    register_blueprints(app, [blueprint])
+
+    return app
+
+
+def create_app(lazy=None):
+    """ Initiate Flask application factory. """
+    app = create_base_app()
+    if lazy is None:
+        lazy = app.config['LAZY_BLUEPRINTS']
+
+    # Import blueprints, routes for application.
+    register_blueprints(app, CORE_BLUEPRINTS)
+    if lazy:
+        app.wsgi_app = LazyBlueprintDispatcher(app.wsgi_app, PROJECT_BLUEPRINTS, create_blueprint_app)
+    else:
+        register_blueprints(app, PROJECT_BLUEPRINTS)
+    page_cache.init_app(app)
+    warmup.init_app(app)
+
+    # db.create_all()
+
+    return app
@@ -0,0 +1,151 @@
+#--------------------------
+# In-process result caches.
+#--------------------------
+
+from collections import OrderedDict
+from threading import Lock
+import time
+
+
+class ResultCache(object):
+    """
+    Thread-safe LRU cache with per-entry TTL.
+
+    Bounded by entry count, and optionally by the total size of entries
+    given a size when set (eg. bytes of a JSON body).
+
+    Entries can carry a tag (eg. the collection they were built from),
+    allowing invalidation of every entry built from a changed source.
+    Tag versions can be synced from a shared store so that processes
+    other than the one serving requests (ingest scripts) can invalidate.
+    """
+
+    def __init__(self, max_entries=256, ttl_seconds=600, sync_interval_seconds=30, max_size=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.total_size = 0
+        self.ttl_seconds = ttl_seconds
+        self.sync_interval_seconds = sync_interval_seconds
+        self.entries = OrderedDict()
+        self.versions = {}
+        self.last_synced = None
+        self.lock = Lock()
+
+
+    def get(self, key):
+        """
+        Returns cached value for key, or None if missing or expired.
+        """
+        with self.lock:
+            try:
+                value, tag, expiry, size = self.entries[key]
+            except KeyError:
+                return None
+
+            if expiry is not None and expiry < time.monotonic():
+                self.remove(key)
+                return None
+
+            # Mark as most recently used.
+            self.entries.move_to_end(key)
+            return value
+
+
+    def set(self, key, value, tag=None, size=0):
+        """
+        Stores value under key, evicting least recently used entries when full.
+        """
+        expiry = None
+        if self.ttl_seconds:
+            expiry = time.monotonic() + self.ttl_seconds
+
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+            self.entries[key] = (value, tag, expiry, size)
+            self.total_size += size
+
+            while len(self.entries) > self.max_entries or self.is_oversized():
+                self.remove(next(iter(self.entries)))
+
+
+    def resize(self, key, value, size):
+        """
+        Updates size of entry under key if it still holds value, eg. once
+        a cached body gains a compressed copy, evicting entries if now oversized.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] is not value:
+                return
+
+            self.entries[key] = entry[:3] + (size,)
+            self.total_size += size - entry[3]
+
+            while self.is_oversized():
+                self.remove(next(iter(self.entries)))
+
+
+    def is_oversized(self):
+        """
+        Returns true if entries exceed max size, keeping at least the newest.
+        """
+        return self.max_size is not None and self.total_size > self.max_size and len(self.entries) > 1
+
+
+    def remove(self, key):
+        """
+        Drops entry under key, lock already held.
+        """
+        entry = self.entries.pop(key)
+        self.total_size -= entry[3]
+
+
+    def invalidate(self, tag=None):
+        """
+        Drops all entries built from tag, or everything if no tag given.
+        """
+        with self.lock:
+            if tag is None:
+                self.entries.clear()
+                self.total_size = 0
+                return
+
+            stale_keys = [key for key, entry in self.entries.items() if entry[1] == tag]
+            for key in stale_keys:
+                self.remove(key)
+
+
+    def should_sync(self):
+        """
+        Returns true if shared tag versions are due for a check.
+        """
+        if self.last_synced is None:
+            return True
+        return time.monotonic() - self.last_synced > self.sync_interval_seconds
+
+
+    def sync_versions(self, versions):
+        """
+        Compares shared tag versions to the ones last seen,
+        invalidating entries of every tag that has changed since.
+        """
+        changed_tags = [tag for tag, version in versions.items() if self.versions.get(tag) != version]
+
+        # Nothing to compare against on first sync.
+        if self.last_synced is not None:
+            for tag in changed_tags:
+                self.invalidate(tag)
+
+        self.versions = dict(versions)
+        self.last_synced = time.monotonic()
+
+        return changed_tags
+
+
+    def note_versions(self, versions):
+        """
+        Records versions bumped by this process, so that its own writes
+        aren't later mistaken for writes made elsewhere.
+        """
+        self.versions.update(versions)
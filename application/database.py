@@ -0,0 +1,96 @@
+#------------------------------------------------------------
+# Shared MongoDB client of the application.
+#------------------------------------------------------------
+
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from urllib.parse import quote_plus
+from .serializers import json_response
+import time
+
+
+def get_mongodb_uri(config):
+    """
+    Connection string from config: MONGODB_URI if set, otherwise
+    built from MONGODB_ID, MONGODB_KEY and MONGODB_HOST.
+    """
+    if config.get('MONGODB_URI'):
+        return config['MONGODB_URI']
+
+    user = quote_plus(config.get('MONGODB_ID') or '')
+    password = quote_plus(config.get('MONGODB_KEY') or '')
+
+    return f'mongodb+srv://{user}:{password}@{config["MONGODB_HOST"]}/'
+
+
+
+class MongoDatabase(object):
+    """
+    One MongoClient, so one connection pool, SRV lookup and TLS handshake
+    per host, shared by every blueprint of the application.
+
+    The client is created in create_app() without connecting: connections
+    are opened by the first query that needs one, not at import time,
+    and a cluster that cannot be reached fails queries after the server
+    selection timeout instead of hanging requests.
+    """
+
+    def __init__(self, app=None):
+        self.client = None
+        if app is not None:
+            self.init_app(app)
+
+
+    def init_app(self, app):
+        """
+        Create the client from app's config, and register health check route.
+        """
+        config = app.config
+        # Created once, apps of lazily loaded blueprints sharing it.
+        if self.client is None:
+            self.client = MongoClient(
+                get_mongodb_uri(config),
+                maxPoolSize=config['MONGODB_MAX_POOL_SIZE'],
+                minPoolSize=config['MONGODB_MIN_POOL_SIZE'],
+                maxIdleTimeMS=config['MONGODB_MAX_IDLE_MS'],
+                serverSelectionTimeoutMS=config['MONGODB_SERVER_SELECTION_TIMEOUT_MS'],
+                connectTimeoutMS=config['MONGODB_CONNECT_TIMEOUT_MS'],
+                appname=config['MONGODB_APP_NAME'],
+                connect=False
+            )
+        app.extensions['mongo'] = self
+        app.add_url_rule('/_health/db', 'database_health', self.health_response, methods=['GET'])
+
+
+    def get_db(self, name):
+        """
+        Get database by name, on the shared client.
+        """
+        return self.client[name]
+
+
+    def health_check(self):
+        """
+        Ping the cluster, returns status and round trip in milliseconds.
+        """
+        start = time.perf_counter()
+        try:
+            self.client.admin.command('ping')
+        except PyMongoError as error:
+            return {'ok': False, 'error': type(error).__name__}
+
+        return {'ok': True, 'ping_ms': round((time.perf_counter() - start) * 1000, 2)}
+
+
+    def health_response(self):
+        '''
+        Health check route, 503 if cluster is unreachable.
+        '''
+        health = self.health_check()
+
+        return json_response(health, status=200 if health['ok'] else 503)
+
+
+
+# Shared by blueprints: from application.database import mongo
+mongo = MongoDatabase()
@@ -0,0 +1,65 @@
+#------------------------------------------------------------
+# Lazy loading of blueprints by URL path prefix.
+#------------------------------------------------------------
+
+from threading import Lock
+
+
+class LazyBlueprintDispatcher(object):
+    """
+    WSGI middleware passing requests under a blueprint's path prefixes to
+    an app holding that blueprint, created on the first such request, and
+    every other request to the wrapped app.
+
+    Heavy imports and startup loads of a blueprint's routes module are
+    only paid when one of its URLs is first hit, not on every cold start.
+    Blueprint apps share the config, so sessions, cookies and the MongoDB
+    client are common to all of them.
+    """
+
+    def __init__(self, wsgi_app, blueprints, create_blueprint_app):
+        self.wsgi_app = wsgi_app
+        self.blueprints = blueprints
+        self.create_blueprint_app = create_blueprint_app
+        self.apps = {}
+        self.lock = Lock()
+
+        # Longest prefixes first, so nested prefixes match their own blueprint.
+        self.prefixes = sorted(
+            [(prefix, blueprint) for blueprint in blueprints for prefix in blueprint[3]],
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
+
+
+    def get_app(self, blueprint):
+        """
+        Get app of blueprint, creating it on first use.
+        """
+        module_name = blueprint[0]
+        app = self.apps.get(module_name)
+        if app is None:
+            with self.lock:
+                app = self.apps.get(module_name)
+                if app is None:
+                    app = self.create_blueprint_app(blueprint)
+                    self.apps[module_name] = app
+
+        return app
+
+
+    def load_all(self):
+        """
+        Create app of every blueprint not loaded yet, eg. on warmup.
+        """
+        for blueprint in self.blueprints:
+            self.get_app(blueprint)
+
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        for prefix, blueprint in self.prefixes:
+            if path == prefix or path.startswith(prefix + '/'):
+                return self.get_app(blueprint)(environ, start_response)
+
+        return self.wsgi_app(environ, start_response)
@@ -0,0 +1,172 @@
+#------------------------------------------------------------
+# Cached rendering of mostly static pages.
+#------------------------------------------------------------
+
+from flask import current_app, request
+from threading import Lock, Thread
+from pymongo import ReturnDocument
+from .database import mongo
+from .serializers import json_response
+import click, hmac, time
+
+# Shared version of cached pages, in projectsIndex's cache_versions.
+PAGES_DB = 'projectsIndex'
+PAGES_VERSION_ID = 'pages'
+
+
+def get_pages_version(db):
+    """
+    Get version of page contents, bumped by invalidations.
+    """
+    version_doc = db['cache_versions'].find_one({'_id': PAGES_VERSION_ID})
+    if version_doc is None:
+        return 0
+
+    return version_doc['version']
+
+
+
+def bump_pages_version(db):
+    """
+    Increment version of page contents, so every instance re-renders
+    its pages on their next refresh.  Returns the new version.
+    """
+    version_doc = db['cache_versions'].find_one_and_update(
+        {'_id': PAGES_VERSION_ID},
+        {'$inc': {'version': 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+    return version_doc['version']
+
+
+
+class PageCache(object):
+    """
+    Rendered HTML of pages by key, with the content version they were
+    rendered at.
+
+    Pages are served from memory.  Once older than PAGE_CACHE_FRESH_SECONDS, the
+    cached page is still served, while a background thread checks the
+    content version and re-renders the page only if it changed, so
+    requests never wait on the database after a page's first render.
+    """
+
+    def __init__(self, get_version):
+        self.get_version = get_version
+        self.pages = {}
+        self.refreshing = set()
+        self.lock = Lock()
+
+
+    def get_page(self, key, render):
+        """
+        Get page of key, rendering it if missing, refreshing it in
+        background if stale.  Needs a request context.
+        """
+        config = current_app.config
+        if not config['PAGE_CACHE_ENABLED']:
+            return render()
+
+        page = self.pages.get(key)
+        if page is None:
+            version = self.get_version()
+            html = render()
+            self.pages[key] = (html, version, time.monotonic())
+            return html
+
+        html, version, checked_at = page
+        if time.monotonic() - checked_at > config['PAGE_CACHE_FRESH_SECONDS']:
+            self.start_refresh(key, render)
+
+        return html
+
+
+    def start_refresh(self, key, render):
+        """
+        Refresh page in a background thread, unless already refreshing.
+        """
+        with self.lock:
+            if key in self.refreshing:
+                return
+            self.refreshing.add(key)
+
+        app = current_app._get_current_object()
+        Thread(target=self.refresh, args=(app, request.path, key, render), daemon=True).start()
+
+
+    def refresh(self, app, path, key, render):
+        """
+        Re-render page if content version changed, otherwise mark it fresh.
+        Keeps serving the cached page if either fails.
+        """
+        try:
+            with app.test_request_context(path):
+                version = self.get_version()
+                page = self.pages.get(key)
+                if page is not None and page[1] == version:
+                    html = page[0]
+                else:
+                    html = render()
+                self.pages[key] = (html, version, time.monotonic())
+        except Exception as error:
+            print(f"Page refresh of {key} failed: {type(error).__name__}: {error}")
+        finally:
+            with self.lock:
+                self.refreshing.discard(key)
+
+
+    def clear(self):
+        """
+        Drop every cached page.
+        """
+        self.pages.clear()
+
+
+
+# Shared by index, projects and resume routes.
+page_cache = PageCache(lambda: get_pages_version(mongo.get_db(PAGES_DB)))
+
+
+def invalidate_pages():
+    '''
+    Admin hook, bumps content version and drops this instance's pages.
+    Other instances re-render on their next refresh.
+    Token required:  Authorization: Bearer <PAGE_CACHE_TOKEN>
+    '''
+    token = current_app.config['PAGE_CACHE_TOKEN']
+    if not token:
+        return json_response({'error': 'Page cache invalidation disabled.'}, status=404)
+
+    auth = request.headers.get('Authorization', '')
+    if not hmac.compare_digest(auth.encode('utf-8'), f'Bearer {token}'.encode('utf-8')):
+        return json_response({'error': 'Invalid token.'}, status=403)
+
+    version = bump_pages_version(mongo.get_db(PAGES_DB))
+    page_cache.clear()
+
+    return json_response({'version': version})
+
+
+
+def init_app(app):
+    """
+    Register invalidation route, and its CLI command, POSTing to a
+    running site (PAGE_CACHE_INVALIDATE_URL unless --url given):
+        flask invalidate-pages
+    """
+    app.add_url_rule('/_admin/invalidate-pages', 'invalidate_pages', invalidate_pages, methods=['POST'])
+
+
+    @app.cli.command('invalidate-pages')
+    @click.option('--url', default=None, help='Invalidation route of the site.')
+    def invalidate_pages_command(url):
+        import requests
+
+        response = requests.post(
+            url or app.config['PAGE_CACHE_INVALIDATE_URL'],
+            headers={'Authorization': f"Bearer {app.config['PAGE_CACHE_TOKEN']}"},
+            timeout=30
+        )
+        print(f">>> {response.status_code} {response.text.strip()}")
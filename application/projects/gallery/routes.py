@@ -2,16 +2,22 @@
 # Route for gallery page.
 #------------------------------------------
 
-from flask import Blueprint, render_template
+from flask import Blueprint, render_template, request
 from flask import current_app as app
+from ...serializers import json_response
 from .assets import build_assets
+from .tools.gallery_store import GalleryStore
 from pathlib import Path
-import numpy as np
-import csv
+import math
 
 DEBUG_MODE = app.config['FLASK_DEBUG']
-FILE_HSL = Path.cwd() / 'application' / 'projects' / 'gallery' / 'tools' / 'hsl_list.npy'
+FILE_HSL = Path.cwd() / 'application' / 'projects' / 'gallery' / 'tools' / 'hsl_swatches.npy'
 FILE_CAPTIONS = Path.cwd() / 'application' / 'projects' / 'gallery' / 'tools' / 'photo_captions.csv'
+FILE_PALETTES = Path.cwd() / 'application' / 'projects' / 'gallery' / 'tools' / 'palettes.npz'
+SIMILAR_DEFAULT_K = 12
+SIMILAR_MAX_K = 100
+# Upper bounds of hue (degrees), saturation and lightness (percent).
+HSL_MAX = (360, 100, 100)
 
 
 # Blueprint config.
@@ -24,6 +30,10 @@ if DEBUG_MODE == True:
     build_assets(app)
 
 
+# Swatches, captions, colour index and palettes, loaded on first use and on file changes.
+gallery_store = GalleryStore(FILE_HSL, FILE_CAPTIONS, FILE_PALETTES)
+
+
 # Gallery route.
 @gallery_bp.route('/gallery', methods=['GET'])
 @gallery_bp.route('/gallery/', methods=['GET'])
@@ -31,22 +41,94 @@ def gallery():
     """ 
     Set up lists for dominant colour and caption for images to pass into gallery.
     """
-    
-    hsl_list = np.load(FILE_HSL, allow_pickle=True)
+    if app.config['GALLERY_MEMOIZE_PAGE']:
+        return gallery_store.get_page(render_gallery)
 
-    swatches = []
-    for row in hsl_list:
-        hsl_color = np.ndarray.tolist(row[1])
-        swatches.append([row[0], hsl_color])
+    return render_gallery(gallery_store.get())
 
-    captions = {}
-    with open(FILE_CAPTIONS) as csv_file:
-        csv_reader = csv.reader(csv_file, delimiter=",")
-        for line in csv_reader:
-            captions[line[0]] = line[1]
 
+def render_gallery(data):
+    """
+    Render gallery page of loaded swatches and captions.
+    """
     return render_template('gallery.html', 
         title="Gallery  ——  jeanings.space", 
-        swatches=swatches, 
-        captions=captions
+        swatches=data.swatches, 
+        captions=data.captions
     )
+
+
+
+# Colour similarity route.
+@gallery_bp.route('/gallery/similar', methods=['GET'])
+def similar():
+    '''
+    Returns images closest in colour to an image (?image=filename) or to an
+    HSL colour (?colour=h,s,l), k of them (?k=, up to SIMILAR_MAX_K).
+    '''
+    data = gallery_store.get()
+    image = request.args.get('image')
+    colour = request.args.get('colour')
+
+    try:
+        k = min(max(int(request.args.get('k', SIMILAR_DEFAULT_K)), 1), SIMILAR_MAX_K)
+    except ValueError:
+        return json_response({'error': 'k must be an integer.'}, status=400)
+
+    if image:
+        if image not in data.index:
+            return json_response({'error': f'No image {image}.'}, status=404)
+        results = data.index.query_image(image, k)
+    elif colour:
+        try:
+            hsl = [float(value) for value in colour.split(',')]
+            if len(hsl) != 3 or not all(math.isfinite(value) and 0 <= value <= limit for value, limit in zip(hsl, HSL_MAX)):
+                raise ValueError(colour)
+        except ValueError:
+            return json_response({'error': 'colour must be h,s,l, within 0-360, 0-100, 0-100.'}, status=400)
+        results = data.index.query_colour(hsl, k)
+    else:
+        return json_response({'error': 'Give image or colour.'}, status=400)
+
+    return json_response({
+        'query': {'image': image} if image else {'colour': hsl},
+        'results': [{
+            'filename': filename,
+            'colour': colour,
+            'caption': data.captions.get(filename),
+            'distance': round(distance, 2)
+        } for filename, colour, distance in results]
+    })
+
+
+
+# Palettes route.
+@gallery_bp.route('/gallery/palettes', methods=['GET'])
+def palettes():
+    '''
+    Returns palettes of every image as columns: filenames, HSL colours and
+    their percent of image, most common first, unused slots' weight 0.
+    With ?image=filename, that image's palette only.
+    '''
+    palette_data = gallery_store.get_palettes()
+    if palette_data is None:
+        return json_response({'error': 'No palettes.'}, status=404)
+
+    image = request.args.get('image')
+    if image:
+        position = palette_data.positions.get(image)
+        if position is None:
+            return json_response({'error': f'No image {image}.'}, status=404)
+
+        return json_response({
+            'filename': image,
+            'palette': [{'colour': colour, 'weight': weight}
+                for colour, weight in zip(palette_data.colours[position].tolist(), palette_data.weights[position].tolist())
+                if weight > 0]
+        })
+
+    return json_response({
+        'filenames': palette_data.filenames,
+        'colours': palette_data.colours.tolist(),
+        'weights': palette_data.weights.tolist()
+    })
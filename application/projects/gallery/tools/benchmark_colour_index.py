@@ -0,0 +1,85 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking colour similarity queries over swatches: build time
+# of ColourIndex's KD-tree, and time per k nearest query by image and by
+# colour, against a vectorized scan of every swatch's CIELAB distance.
+#   python benchmark_colour_index.py
+#------------------------------------------------------------------------------
+
+from colour_index import ColourIndex, hsl_to_lab
+import numpy as np
+import time
+
+IMAGE_COUNTS = [190, 10000, 50000]
+QUERIES = 2000
+K = 12
+
+
+def create_swatches(count, seed=5):
+    """
+    Build filenames and HSL colours like hsl_swatches.npy's.
+    """
+    rng = np.random.default_rng(seed)
+    filenames = [f'{2010 + i % 12}-{1 + i % 12:02}-{1 + i % 28:02} {i:05}.jpg' for i in range(count)]
+    hsl = np.around(rng.uniform([0, 0, 0], [360, 100, 100], size=(count, 3))).astype(np.float32)
+
+    return filenames, hsl
+
+
+
+def scan(lab, hsl, k):
+    """
+    Positions of k nearest swatches to colour, by distance to every swatch.
+    """
+    distances = ((lab - hsl_to_lab(hsl)[0]) ** 2).sum(axis=1)
+    nearest = np.argpartition(distances, k)[:k]
+
+    return nearest[np.argsort(distances[nearest])]
+
+
+
+def time_queries(query, arguments):
+    """
+    Mean ms per query over arguments.
+    """
+    start = time.perf_counter()
+    for argument in arguments:
+        query(argument)
+
+    return (time.perf_counter() - start) / len(arguments) * 1000
+
+
+
+def main():
+    print(f'{"images":>7} {"build ms":>9} | {"image ms":>9} {"colour ms":>10} | {"scan ms":>8} {"same":>5}')
+
+    for count in IMAGE_COUNTS:
+        filenames, hsl = create_swatches(count)
+
+        start = time.perf_counter()
+        index = ColourIndex(filenames, hsl)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        rng = np.random.default_rng(7)
+        images = [filenames[position] for position in rng.integers(0, count, QUERIES)]
+        colours = rng.uniform([0, 0, 0], [360, 100, 100], size=(QUERIES, 3))
+
+        image_ms = time_queries(lambda image: index.query_image(image, K), images)
+        colour_ms = time_queries(lambda colour: index.query_colour(colour, K), colours)
+        scan_ms = time_queries(lambda colour: scan(index.lab, colour, K), colours)
+
+        # Same neighbours as a full scan, by distance (ties may order differently).
+        same = all(
+            np.allclose(
+                [distance for filename, colour, distance in index.query_colour(colour, K)],
+                np.sqrt(((index.lab[scan(index.lab, colour, K)] - hsl_to_lab(colour)[0]) ** 2).sum(axis=1)),
+                atol=1e-3
+            )
+            for colour in colours[:100]
+        )
+
+        print(f'{count:7} {build_ms:9.2f} | {image_ms:9.3f} {colour_ms:10.3f} | {scan_ms:8.3f} {str(same):>5}')
+
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking load time and resident memory of swatch files:
+# legacy pickled object arrays against structured arrays, read whole or
+# memory-mapped, with and without building the gallery's Python tuples.
+# Each run is a fresh subprocess, resident memory read from /proc (Linux).
+#   python benchmark_swatch_formats.py
+#------------------------------------------------------------------------------
+
+from pathlib import Path
+from swatch_format import to_swatch_array, save_swatches, load_swatches, iterate_swatches
+import numpy as np
+import json, os, random, subprocess, sys, tempfile, time
+
+IMAGE_COUNTS = [190, 10000, 50000]
+REPEATS = 5
+MODES = ['legacy', 'structured', 'mmap', 'legacy+tuples', 'mmap+tuples']
+
+
+def create_rows(count, seed=5):
+    """
+    Build [filename, hsl array] rows like hsl_list.npy's.
+    """
+    rng = random.Random(seed)
+
+    return [[f'{2010 + i % 12}-{1 + i % 12:02}-{1 + i % 28:02} {i:05}.jpg',
+        np.around(np.array([rng.uniform(0, 360), rng.uniform(0, 100), rng.uniform(0, 100)]))]
+        for i in range(count)]
+
+
+
+def write_files(folder, count):
+    """
+    Write legacy and structured files of count swatches, returns their paths.
+    """
+    rows = create_rows(count)
+    legacy_file = folder / f'hsl_list_{count}.npy'
+    swatch_file = folder / f'hsl_swatches_{count}.npy'
+
+    legacy = np.empty((len(rows), 2), dtype=object)
+    legacy[:] = rows
+    np.save(legacy_file, legacy)
+    save_swatches(swatch_file, to_swatch_array(rows))
+
+    return legacy_file, swatch_file
+
+
+
+def load(mode, legacy_file, swatch_file):
+    """
+    Load swatches as mode does.
+    """
+    if mode == 'legacy':
+        return np.load(legacy_file, allow_pickle=True)
+    if mode == 'legacy+tuples':
+        # As gallery() did on every request.
+        return [[row[0], np.ndarray.tolist(row[1])] for row in np.load(legacy_file, allow_pickle=True)]
+    if mode == 'structured':
+        return load_swatches(swatch_file, mmap=False)
+    if mode == 'mmap':
+        swatches = load_swatches(swatch_file)
+        # Touch colours, as a similarity query would.
+        swatches['colour'].sum()
+        return swatches
+
+    return tuple(iterate_swatches(load_swatches(swatch_file)))
+
+
+
+def get_rss_kb():
+    """
+    Resident memory of this process.
+    """
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+
+def run_mode(mode, legacy_file, swatch_file):
+    """
+    Measure one mode in this process, prints results as JSON.
+    """
+    rss_before = get_rss_kb()
+    swatches = load(mode, legacy_file, swatch_file)
+    rss_after = get_rss_kb()
+
+    timings = []
+    for repeat in range(REPEATS):
+        start = time.perf_counter()
+        load(mode, legacy_file, swatch_file)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    print(json.dumps({'ms': min(timings), 'rss_kb': rss_after - rss_before}))
+
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        print(f'{"images":>7} {"mode":>14} {"file KB":>8} {"load ms":>9} {"RSS +KB":>8}')
+
+        for count in IMAGE_COUNTS:
+            legacy_file, swatch_file = write_files(Path(folder), count)
+
+            for mode in MODES:
+                output = subprocess.run(
+                    [sys.executable, __file__, mode, str(legacy_file), str(swatch_file)],
+                    capture_output=True, text=True, check=True
+                ).stdout
+                results = json.loads(output.strip().splitlines()[-1])
+                file_kb = (legacy_file if mode.startswith('legacy') else swatch_file).stat().st_size / 1024
+
+                print(f'{count:7} {mode:>14} {file_kb:8.0f} {results["ms"]:9.2f} {results["rss_kb"]:8}')
+
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run_mode(sys.argv[1], sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,112 @@
+#-------------------------------------------------------------------
+#   Nearest colour search over gallery swatches, in CIELAB, where
+#   euclidean distance (CIE76 delta E) follows perceived difference.
+#-------------------------------------------------------------------
+
+from scipy.spatial import cKDTree
+import numpy as np
+
+# sRGB (D65) to CIE XYZ, and D65 reference white.
+RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041]
+], dtype=np.float32)
+WHITE_D65 = np.array([0.95047, 1.0, 1.08883], dtype=np.float32)
+
+
+def hsl_to_rgb(hsl):
+    """
+    Convert (n, 3) HSL rows, hue in degrees and saturation, lightness
+    in percent as in swatch files, to sRGB rows in 0-1.
+    """
+    hsl = np.asarray(hsl, dtype=np.float32).reshape(-1, 3)
+    hue = hsl[:, 0:1] % 360
+    saturation = hsl[:, 1:2] / 100
+    lightness = hsl[:, 2:3] / 100
+
+    # HSL to RGB, alternative formula -> https://en.wikipedia.org/wiki/HSL_and_HSV#HSL_to_RGB_alternative
+    k = (np.array([0, 8, 4], dtype=np.float32) + hue / 30) % 12
+    a = saturation * np.minimum(lightness, 1 - lightness)
+
+    return lightness - a * np.clip(np.minimum(k - 3, 9 - k), -1, 1)
+
+
+
+def rgb_to_lab(rgb):
+    """
+    Convert (n, 3) sRGB rows in 0-1 to CIELAB rows.
+    """
+    rgb = np.asarray(rgb, dtype=np.float32)
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ RGB_TO_XYZ.T / WHITE_D65
+
+    epsilon, kappa = 216 / 24389, 24389 / 27
+    f = np.where(xyz > epsilon, np.cbrt(xyz), (kappa * xyz + 16) / 116)
+
+    return np.stack([
+        116 * f[:, 1] - 16,
+        500 * (f[:, 0] - f[:, 1]),
+        200 * (f[:, 1] - f[:, 2])
+    ], axis=1).astype(np.float32)
+
+
+
+def hsl_to_lab(hsl):
+    """
+    Convert (n, 3) HSL rows of swatch files to CIELAB rows.
+    """
+    return rgb_to_lab(hsl_to_rgb(hsl))
+
+
+
+class ColourIndex(object):
+    """
+    KD-tree over swatches' colours in CIELAB, answering which images
+    are closest in colour to an image or to a colour.
+    """
+
+    def __init__(self, filenames, hsl):
+        self.filenames = list(filenames)
+        self.positions = {filename: position for position, filename in enumerate(self.filenames)}
+        # Copied, so the index never reads a memory-mapped swatch file.
+        self.hsl = np.array(hsl, dtype=np.float32, copy=True).reshape(-1, 3)
+        self.lab = hsl_to_lab(self.hsl)
+        self.tree = cKDTree(self.lab)
+
+
+    def __len__(self):
+        return len(self.filenames)
+
+
+    def __contains__(self, filename):
+        return filename in self.positions
+
+
+    def query_colour(self, hsl, k, exclude=None):
+        """
+        Get k (filename, HSL colour, delta E) closest to HSL colour, nearest first,
+        leaving out position exclude.
+        """
+        count = min(k + (exclude is not None), len(self.filenames))
+        if count == 0:
+            return []
+
+        distances, positions = self.tree.query(hsl_to_lab(hsl)[0], k=count)
+        distances, positions = np.atleast_1d(distances), np.atleast_1d(positions)
+
+        return [
+            (self.filenames[position], tuple(self.hsl[position].tolist()), distance)
+            for distance, position in zip(distances.tolist(), positions.tolist())
+            if position != exclude
+        ][:k]
+
+
+    def query_image(self, filename, k):
+        """
+        Get k (filename, HSL colour, delta E) closest to image's colour, nearest first,
+        the image itself left out. Raises KeyError if image isn't indexed.
+        """
+        position = self.positions[filename]
+
+        return self.query_colour(self.hsl[position], k, exclude=position)
@@ -0,0 +1,79 @@
+#------------------------------------------------------------------------------
+# Script comparing dominant colour estimators over a sample folder of images:
+# time per image of each, and hue distance of fast estimators' colours to
+# those of kmeans (find_color(), full image KMeans, as swatches were made).
+# Hue is meaningless for near-grey colours, so distances are also given over
+# images whose kmeans colour has saturation of at least MIN_SATURATION.
+# Run from the project root, sample folder defaults to the gallery's images:
+#   python application/projects/gallery/tools/compare_estimators.py [folder] [count]
+#------------------------------------------------------------------------------
+
+from pathlib import Path
+from quantize import ESTIMATORS, IMG_FOLDER, EXCLUDE_DIRS, IMAGE_EXTENSIONS
+import numpy as np
+import sys, time
+
+SAMPLE_COUNT = 50
+MIN_SATURATION = 15
+BASELINE = 'kmeans'
+
+
+def get_sample_images(folder, count):
+    """
+    First count images of folder, by name, skipping thumbnails and other excluded directories.
+    """
+    images = sorted([path for path in folder.rglob('*') if path.suffix.lower() in IMAGE_EXTENSIONS
+        and not EXCLUDE_DIRS.intersection(path.relative_to(folder).parts[:-1])])
+
+    return images[:count]
+
+
+
+def get_hue_distance(hue_a, hue_b):
+    """
+    Distance between hues in degrees, around the colour wheel.
+    """
+    distance = abs(hue_a - hue_b) % 360
+
+    return min(distance, 360 - distance)
+
+
+
+def main(folder, count):
+    images = get_sample_images(folder, count)
+    print(f'{len(images)} images of {folder}')
+
+    colors = {estimator: [] for estimator in ESTIMATORS}
+    timings = {estimator: [] for estimator in ESTIMATORS}
+    for image in images:
+        for estimator, find in ESTIMATORS.items():
+            start = time.perf_counter()
+            # Absolute path, joined to IMG_FOLDER as is.
+            colors[estimator].append(find(str(image.resolve()))[0][1])
+            timings[estimator].append(time.perf_counter() - start)
+
+    baseline = colors[BASELINE]
+    saturated = [color[1] >= MIN_SATURATION for color in baseline]
+    baseline_ms = np.mean(timings[BASELINE]) * 1000
+
+    print(f'\n{"estimator":>10} {"ms/image":>9} {"speedup":>8} | hue distance to {BASELINE}: '
+        f'{"mean":>6} {"median":>7} {"p90":>6} {"<=10°":>6} | saturated ({sum(saturated)}): {"mean":>6} {"<=10°":>6}')
+
+    for estimator in ESTIMATORS:
+        ms = np.mean(timings[estimator]) * 1000
+        distances = np.array([get_hue_distance(color[0], base[0]) for color, base in zip(colors[estimator], baseline)])
+        saturated_distances = distances[np.array(saturated, dtype=bool)]
+        if len(saturated_distances) == 0:
+            saturated_distances = np.array([np.nan])
+
+        print(f'{estimator:>10} {ms:9.1f} {baseline_ms / ms:7.1f}x |{"":>24}'
+            f'{distances.mean():6.1f} {np.median(distances):7.1f} {np.percentile(distances, 90):6.1f}'
+            f' {np.mean(distances <= 10):6.0%} |{"":>16}{saturated_distances.mean():6.1f}'
+            f' {np.mean(saturated_distances <= 10):6.0%}')
+
+
+
+if __name__ == '__main__':
+    folder = Path(sys.argv[1]) if len(sys.argv) > 1 else IMG_FOLDER
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else SAMPLE_COUNT
+    main(folder, count)
@@ -0,0 +1,45 @@
+#-------------------------------------------------------------------
+#   Converts legacy pickled swatch lists (hsl_list.npy, hsv_list.npy)
+#   into structured swatch files (hsl_swatches.npy, hsv_swatches.npy).
+#   Run from the project root:
+#       python application/projects/gallery/tools/convert_swatches.py
+#-------------------------------------------------------------------
+
+from pathlib import Path
+from swatch_format import load_legacy_swatches, load_swatches, save_swatches
+import numpy as np
+
+TOOLS_FOLDER = Path.cwd() / 'application' / 'projects' / 'gallery' / 'tools'
+CONVERSIONS = {
+    'hsl_list.npy': 'hsl_swatches.npy',
+    'hsv_list.npy': 'hsv_swatches.npy'
+}
+
+
+def convert(legacy_file, swatch_file):
+    """
+    Convert legacy file, checking the written file reads back the same.
+    """
+    swatches = load_legacy_swatches(legacy_file)
+    save_swatches(swatch_file, swatches)
+
+    written = load_swatches(swatch_file)
+    assert np.array_equal(written, swatches)
+
+    return swatches
+
+
+
+def main():
+    for legacy_name, swatch_name in CONVERSIONS.items():
+        legacy_file = TOOLS_FOLDER / legacy_name
+        if not legacy_file.is_file():
+            print(f">>> {legacy_name} not found, skipped.")
+            continue
+
+        swatches = convert(legacy_file, TOOLS_FOLDER / swatch_name)
+        print(f">>> {legacy_name} -> {swatch_name}: {len(swatches)} swatches, {swatches.dtype}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#-------------------------------------------------------------------
+#   Gallery swatches and captions, held in memory.
+#-------------------------------------------------------------------
+
+from collections import namedtuple
+from threading import Lock
+from .colour_index import ColourIndex
+from .swatch_format import load_swatches, iterate_swatches, load_palettes
+import csv, os
+
+# Loaded data, replaced whole on reload:
+#   version     mtimes of files it was loaded from,
+#   swatches    ((filename, (h, s, l)), ...) in file order,
+#   captions    {filename: caption}, never modified once loaded,
+#   index       ColourIndex of swatches, kept while swatches file is unchanged.
+GalleryData = namedtuple('GalleryData', ['version', 'swatches', 'captions', 'index'])
+
+# Loaded palettes, replaced whole on reload:
+#   version     mtime of palettes file,
+#   filenames   [filename, ...] in file order,
+#   positions   {filename: row},
+#   colours     float32 HSL colours, image x palette x 3,
+#   weights     uint8 percent of image of each colour, image x palette, 0 if unused.
+PaletteData = namedtuple('PaletteData', ['version', 'filenames', 'positions', 'colours', 'weights'])
+
+
+def load_captions(captions_path):
+    """
+    Read captions of photo_captions.csv, filename and caption per line.
+    """
+    captions = {}
+    with open(captions_path) as csv_file:
+        csv_reader = csv.reader(csv_file, delimiter=",")
+        for line in csv_reader:
+            captions[line[0]] = line[1]
+
+    return captions
+
+
+
+class GalleryStore(object):
+    """
+    Swatches, captions and colour index of swatches loaded on first use,
+    and reloaded when either file's mtime changes, so regenerated files
+    are served without restart. The index is only rebuilt if swatches changed.
+    Also holds the page rendered from the current data, if memoized, and
+    palettes, loaded and reloaded apart as the gallery page doesn't use them.
+    """
+
+    def __init__(self, hsl_path, captions_path, palettes_path=None):
+        self.hsl_path = hsl_path
+        self.captions_path = captions_path
+        self.palettes_path = palettes_path
+        self.data = None
+        self.palettes = None
+        self.page = None
+        self.lock = Lock()
+
+
+    def get_version(self):
+        """
+        Get mtimes of source files.
+        """
+        return (os.stat(self.hsl_path).st_mtime_ns, os.stat(self.captions_path).st_mtime_ns)
+
+
+    def get(self):
+        """
+        Get loaded data, loading it if missing or if files changed.
+        """
+        version = self.get_version()
+        data = self.data
+        if data is None or data.version != version:
+            with self.lock:
+                data = self.data
+                if data is None or data.version != version:
+                    data = self.load(version, data)
+                    self.data = data
+
+        return data
+
+
+    def load(self, version, previous):
+        """
+        Load data of files at version, keeping previous data's swatches and
+        index if only captions changed.
+        """
+        if previous is not None and previous.version[0] == version[0]:
+            swatches, index = previous.swatches, previous.index
+        else:
+            swatch_array = load_swatches(self.hsl_path)
+            swatches = tuple(iterate_swatches(swatch_array))
+            index = ColourIndex([filename for filename, colour in swatches], swatch_array['colour'])
+
+        return GalleryData(version, swatches, load_captions(self.captions_path), index)
+
+
+    def get_page(self, render):
+        """
+        Get page rendered from current data, rendering it on first use
+        and after reloads.
+        """
+        data = self.get()
+        page = self.page
+        if page is None or page[0] != data.version:
+            page = (data.version, render(data))
+            self.page = page
+
+        return page[1]
+
+
+    def get_palettes(self):
+        """
+        Get loaded palettes, loading them if missing or if file changed.
+        None if there's no palettes file.
+        """
+        if self.palettes_path is None or not os.path.isfile(self.palettes_path):
+            return None
+
+        version = os.stat(self.palettes_path).st_mtime_ns
+        palettes = self.palettes
+        if palettes is None or palettes.version != version:
+            with self.lock:
+                palettes = self.palettes
+                if palettes is None or palettes.version != version:
+                    columns = load_palettes(self.palettes_path)
+                    filenames = [filename.decode('utf-8') for filename in columns['filename'].tolist()]
+                    positions = {filename: position for position, filename in enumerate(filenames)}
+                    palettes = PaletteData(version, filenames, positions, columns['colour'], columns['weight'])
+                    self.palettes = palettes
+
+        return palettes
@@ -5,14 +5,42 @@
 from skimage import data, io
 from skimage.color import rgb2hsv
 from skimage.transform import rescale
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from PIL import Image
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from swatch_format import (
+    to_swatch_array,
+    save_swatches,
+    load_swatches,
+    iterate_swatches,
+    save_cache,
+    load_cache,
+    save_palettes
+)
 import numpy as np
-import matplotlib, pprint
+import argparse, colorsys, matplotlib, os, pprint
 
-IMG_FOLDER = Path.cwd() / "application" / "static" / "images"
-PROJ_FOLDER = Path.cwd() / "application" / "gallery" / "tools"
+IMG_FOLDER = Path.cwd() / "application" / "static" / "images" / "gallery"
+PROJ_FOLDER = Path.cwd() / "application" / "projects" / "gallery" / "tools"
 OUTPUT = IMG_FOLDER / 'quantized'
+EXCLUDE_DIRS = set(['quantized', 'thumbs', 'hi_res'])
+IMAGE_EXTENSIONS = set(['.jpg', '.jpeg', '.png'])
+
+# Swatch files, and cache of quantized images by filename, mtime and size.
+HSV_FILE = PROJ_FOLDER / 'hsv_swatches.npy'
+HSL_FILE = PROJ_FOLDER / 'hsl_swatches.npy'
+CACHE_FILE = PROJ_FOLDER / 'quantize_cache.npy'
+CACHE_SAVE_EVERY = 50
+
+# Fast estimators: pixels decoded per image, colours fitted, histogram bins per channel.
+PIXEL_BUDGET = 16384
+N_COLORS = 10
+HISTOGRAM_BITS = 4
+
+# Palettes: colours kept per image, most common first, and file of HSL palettes.
+PALETTE_SIZE = 6
+PALETTE_FILE = PROJ_FOLDER / 'palettes.npz'
 
 
 def hsv_to_hsl(hsv_data):
@@ -34,8 +62,8 @@ def hsv_to_hsl(hsv_data):
     return hsl_data
     
 
-def find_color(filename):
-    """ Calculates the dominant colour for pass-in image. """
+def find_palette(filename):
+    """ Calculates the palette of pass-in image: its colours, most common first, with proportions. """
     image_path = IMG_FOLDER / filename
     print("Analysing: " + filename)
     image = io.imread(image_path, as_gray=False)
@@ -71,54 +99,247 @@ def find_color(filename):
 
     # Convert to HSV values to rank in order of hue.
     image_hsv = rgb2hsv(image_quantized)
-    hsv_dict = {}
+    hsv_counts = []
     colors, counts = np.unique(image_hsv.reshape(image_array.shape), return_counts=True, axis=0)
     for color, count in zip(colors, counts):
         color[0], color[1:] = np.round(color[0]*360, decimals=2), np.round(color[1:]*100, decimals=2)  
-        hsv_dict[count] = color.tolist()
+        hsv_counts.append((int(count), color.tolist()))
     
-    hsv_sorted = sorted(hsv_dict.items(), key=lambda x: x[0], reverse=True)
+    # Most common first, ties to the greater colour.
+    hsv_sorted = sorted(hsv_counts, reverse=True)[:PALETTE_SIZE]
+
+    return to_palette([color for count, color in hsv_sorted], [count for count, color in hsv_sorted], len(image_array))
+
+
+def find_color(filename):
+    """ Calculates the dominant colour for pass-in image. """
     main_hsv_color = []
-    main_hsv_color.append([filename, hsv_sorted[0][1]])
+    main_hsv_color.append([filename, find_palette(filename)[0][0]])
     
     return main_hsv_color
 
 
-def main():
-    """ Crawl through images directory and quantize images to get dominant color value. """
-    hsv = []
-    quantized_file = PROJ_FOLDER / 'hsv_list.npy'
-
-    # Crawls through directory, calls find_color for each image found.
-    if not quantized_file.is_file():
-        exclude_dirs = set(['quantized'])
-        
-        for root, dirs, files in os.walk(IMG_FOLDER, topdown=True):
-            [dirs.remove(dir) for dir in list(dirs) if dir in exclude_dirs]
-            for file in files:
-                main_hsv_color = find_color(file)
-                hsv.append([main_hsv_color[0][0], main_hsv_color[0][1]])
-                print(main_hsv_color[0][0], "done.")
-        
-        np.save(quantized_file, hsv)
-    
+def to_palette(colors, counts, total):
+    """ Palette of HSV colours, most common first, and their proportions of total pixels. """
+    return ([list(color) for color in colors], [float(count) / total for count in counts])
+
+
+def load_pixels(image_path, pixel_budget=PIXEL_BUDGET):
+    """
+    uint8 RGB pixels of image, downscaled to about pixel_budget pixels,
+    JPEGs while decoding (draft), at 1/2, 1/4 or 1/8 scale.
+    """
+    with Image.open(image_path) as image:
+        scale = (pixel_budget / (image.width * image.height)) ** 0.5
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        if scale < 1:
+            image.draft('RGB', size)
+        image = image.convert('RGB')
+        if scale < 1:
+            image.thumbnail(size)
+
+        return np.asarray(image, dtype=np.uint8).reshape(-1, 3)
+
+
+def rgb_to_hsv_color(rgb):
+    """ uint8 RGB colour to HSV as find_color() outputs it: degrees, percents. """
+    h, s, v = colorsys.rgb_to_hsv(*(float(channel) / 255 for channel in rgb))
+
+    return [round(h * 360, 2), round(s * 100, 2), round(v * 100, 2)]
+
+
+def find_palette_minibatch(filename):
+    """
+    Palette of image, from MiniBatchKMeans over a decode-time downscaled
+    image: cluster centres, by pixels they hold.
+    """
+    pixels = load_pixels(IMG_FOLDER / filename)
+    kmeans_model = MiniBatchKMeans(n_clusters=N_COLORS, random_state=5, batch_size=1024)
+    kmeans_model.fit(pixels.astype(np.float32))
+
+    counts = np.bincount(kmeans_model.labels_, minlength=N_COLORS)
+    order = np.argsort(-counts, kind='stable')[:PALETTE_SIZE]
+    order = order[counts[order] > 0]
+    colors = [rgb_to_hsv_color(center.astype('uint8')) for center in kmeans_model.cluster_centers_[order]]
+
+    return to_palette(colors, counts[order], len(pixels))
+
+
+def find_color_minibatch(filename):
+    """
+    Dominant colour of image, from MiniBatchKMeans over a decode-time
+    downscaled image: the centre of the cluster holding most pixels.
+    """
+    return [[filename, find_palette_minibatch(filename)[0][0]]]
+
+
+def find_palette_histogram(filename):
+    """
+    Palette of image, from a 3D histogram of a decode-time downscaled
+    image: mean colours of pixels in the fullest bins, by pixels they hold.
+    """
+    pixels = load_pixels(IMG_FOLDER / filename)
+    shift = 8 - HISTOGRAM_BITS
+    bins = pixels >> shift
+    bin_index = (bins[:, 0].astype(np.int32) << (2 * HISTOGRAM_BITS)) | (bins[:, 1].astype(np.int32) << HISTOGRAM_BITS) | bins[:, 2]
+
+    counts = np.bincount(bin_index, minlength=1 << (3 * HISTOGRAM_BITS))
+    order = np.argsort(-counts, kind='stable')[:PALETTE_SIZE]
+    order = order[counts[order] > 0]
+
+    # Mean colour of each bin: channel sums over pixel counts.
+    sums = np.stack([np.bincount(bin_index, weights=pixels[:, channel], minlength=len(counts)) for channel in range(3)], axis=1)
+    means = sums[order] / counts[order, None]
+    colors = [rgb_to_hsv_color(mean.astype('uint8')) for mean in means]
+
+    return to_palette(colors, counts[order], len(pixels))
+
+
+def find_color_histogram(filename):
+    """
+    Dominant colour of image, from a 3D histogram of a decode-time
+    downscaled image: the mean colour of pixels in the fullest bin.
+    """
+    return [[filename, find_palette_histogram(filename)[0][0]]]
+
+
+# Dominant colour estimators, selectable per run.
+ESTIMATORS = {
+    'kmeans': find_color,
+    'minibatch': find_color_minibatch,
+    'histogram': find_color_histogram
+}
+
+# Palettes of each estimator, their first colour its dominant one.
+PALETTE_ESTIMATORS = {
+    'kmeans': find_palette,
+    'minibatch': find_palette_minibatch,
+    'histogram': find_palette_histogram
+}
+
+
+def get_cache_file(estimator):
+    """ Cache file of estimator, colours of each estimator cached apart. """
+    if estimator == 'kmeans':
+        return CACHE_FILE
+
+    return PROJ_FOLDER / f'quantize_cache_{estimator}.npy'
+
+
+def get_image_files():
+    """
+    Images by bare filename, as the gallery's template and captions key them,
+    {filename: path relative to IMG_FOLDER}, skipping excluded directories.
+    """
+    image_files = {}
+    for root, dirs, files in os.walk(IMG_FOLDER, topdown=True):
+        [dirs.remove(dir) for dir in list(dirs) if dir in EXCLUDE_DIRS]
+        for file in sorted(files):
+            if Path(file).suffix.lower() not in IMAGE_EXTENSIONS:
+                continue
+            path = (Path(root) / file).relative_to(IMG_FOLDER).as_posix()
+            if file in image_files:
+                print(path, "skipped, same filename as", image_files[file])
+                continue
+            image_files[file] = path
+
+    return dict(sorted(image_files.items()))
+
+
+def get_file_key(path):
+    """ Cache key of image file: mtime and size, changing when it's replaced. """
+    stat = (IMG_FOLDER / path).stat()
+
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_cached_colors(image_keys, estimator='kmeans'):
+    """
+    Cached colours and palettes of images unchanged since quantized,
+    {filename: (key, colour, palette)}. Entries cached before palettes
+    were kept are left out, to be quantized again.
+    """
+    cache_file = get_cache_file(estimator)
+    cache = load_cache(cache_file) if cache_file.is_file() else {}
+
+    return {filename: entry for filename, entry in cache.items()
+        if filename in image_keys and entry[0] == image_keys[filename] and entry[2] is not None}
+
+
+def quantize_palette(path, estimator='kmeans'):
+    """ HSV palette of image at path relative to IMG_FOLDER, dominant colour first, in a worker process. """
+    return PALETTE_ESTIMATORS[estimator](path)
+
+
+def quantize_images(image_files, workers=None, estimator='kmeans'):
+    """
+    Quantize images of {filename: path} over a process pool, yields
+    (filename, palette) as each completes, palette None if it failed.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(quantize_palette, path, estimator): filename for filename, path in image_files.items()}
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                yield filename, future.result()
+            except Exception as error:
+                print(filename, "failed:", error)
+                yield filename, None
+
+
+def main(workers=None, full=False, estimator='kmeans'):
+    """
+    Quantize new and changed images to get dominant color values and palettes,
+    merge them with cached ones, write HSV and HSL-sorted swatch files and
+    HSL palettes file.
+    """
+    image_files = get_image_files()
+    image_keys = {filename: get_file_key(path) for filename, path in image_files.items()}
+    entries = {} if full else get_cached_colors(image_keys, estimator)
+    cache_file = get_cache_file(estimator)
+    changed = {filename: path for filename, path in image_files.items() if filename not in entries}
+    print(f"{len(image_files)} images: {len(entries)} cached, {len(changed)} to quantize.")
+
+    # Cache saved as results arrive, so interrupted runs keep their progress.
+    for done, (filename, palette) in enumerate(quantize_images(changed, workers, estimator), start=1):
+        if palette is not None:
+            entries[filename] = (image_keys[filename], palette[0][0], palette)
+            print(filename, "done.", f"({done}/{len(changed)})")
+        if done % CACHE_SAVE_EVERY == 0:
+            save_cache(cache_file, entries)
+    save_cache(cache_file, entries)
+
+    # Swatches of current images, failed ones left out.
+    hsv = [[filename, entries[filename][1]] for filename in image_files if filename in entries]
+    save_swatches(HSV_FILE, to_swatch_array(hsv))
+
     # Convert to HSL for export to HTML.
     hsl_list = []
-    hsv_list = np.load(quantized_file, allow_pickle=True)
-    for entry in hsv_list:
-        hsl_conversion = hsv_to_hsl(entry[1])
+    for filename, hsv_color in iterate_swatches(load_swatches(HSV_FILE)):
+        hsl_conversion = hsv_to_hsl(hsv_color)
         hsl = np.array(hsl_conversion).ravel()
-        hsl_list.append([entry[0], hsl])
+        hsl_list.append([filename, hsl])
     
     # Sort by hue, luminance, saturation.
     hsl_sorted = sorted(hsl_list, key=lambda x: (x[1][0], x[1][2], x[1][1]))
+    save_swatches(HSL_FILE, to_swatch_array(hsl_sorted))
 
-    hsl_file = PROJ_FOLDER / 'hsl_list.npy'
-    if not hsl_file.is_file():
-        np.save(hsl_file, hsl_sorted)
+    # Palettes in HSL, in swatches' order.
+    palettes = []
+    for filename, hsl in hsl_sorted:
+        colors, weights = entries[filename][2]
+        palettes.append((filename, [np.array(hsv_to_hsl(color)).ravel() for color in colors], weights))
+    save_palettes(PALETTE_FILE, palettes)
     
     print("\nImages quantized and HSL-sorted. Closing program.\n")
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Quantize gallery images' dominant colours.")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes, default CPU count.")
+    parser.add_argument('--full', action='store_true', help="Ignore cache, quantize every image.")
+    parser.add_argument('--estimator', choices=list(ESTIMATORS), default='kmeans',
+        help="kmeans (full image, as originally), or fast minibatch or histogram.")
+    args = parser.parse_args()
+
+    main(workers=args.workers, full=args.full, estimator=args.estimator)
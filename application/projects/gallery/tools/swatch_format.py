@@ -0,0 +1,182 @@
+#-------------------------------------------------------------------
+#   Swatch files: one structured .npy record per image, filename and
+#   colour, loadable memory-mapped without pickle.
+#-------------------------------------------------------------------
+
+import numpy as np
+import os, tempfile
+
+# Colour of each swatch, three float32 columns (hue, saturation, lightness or value).
+COLOUR_DTYPE = ('<f4', (3,))
+
+
+def get_swatch_dtype(filename_width):
+    """
+    Record of a swatch: fixed-width UTF-8 filename, colour.
+    """
+    return np.dtype([('filename', f'S{filename_width}'), ('colour',) + COLOUR_DTYPE])
+
+
+
+def to_swatch_array(rows):
+    """
+    Structured array of [filename, colour] rows, as quantize.py builds them,
+    filenames as wide as the longest's UTF-8 bytes.
+    """
+    rows = [(str(filename).encode('utf-8'), tuple(float(value) for value in colour)) for filename, colour in rows]
+    filename_width = max([len(filename) for filename, colour in rows], default=1)
+
+    return np.array(rows, dtype=get_swatch_dtype(filename_width))
+
+
+
+def write_replacing(path, write):
+    """
+    Write file with write(file) to a temporary file beside path, then move
+    it over path, so processes with path memory-mapped keep the old file
+    whole instead of reading a half-written one.
+    """
+    folder, name = os.path.split(os.fspath(path))
+    descriptor, temp_path = tempfile.mkstemp(prefix=f'.{name}.', dir=folder or '.')
+    try:
+        with os.fdopen(descriptor, 'wb') as temp_file:
+            write(temp_file)
+        # Keep mode of file replaced, temporary files being owner-only.
+        os.chmod(temp_path, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+
+def save_swatches(path, swatches):
+    """
+    Write structured swatch array to .npy.
+    """
+    write_replacing(path, lambda file: np.save(file, swatches, allow_pickle=False))
+
+
+
+def load_swatches(path, mmap=True):
+    """
+    Read swatch file, memory-mapped read-only unless mmap is false.
+    Never unpickles, unlike legacy object array files.
+    """
+    return np.load(path, mmap_mode='r' if mmap else None, allow_pickle=False)
+
+
+
+def load_legacy_swatches(path):
+    """
+    Read legacy object array file (hsl_list.npy, hsv_list.npy) of
+    [filename, colour] rows into a structured array.
+    """
+    return to_swatch_array(np.load(path, allow_pickle=True))
+
+
+
+def iterate_swatches(swatches):
+    """
+    Swatches as (filename, (h, s, l)) tuples of Python values.
+    """
+    filenames = [filename.decode('utf-8') for filename in swatches['filename'].tolist()]
+
+    return zip(filenames, map(tuple, swatches['colour'].tolist()))
+
+
+
+def get_cache_dtype(filename_width, palette_size):
+    """
+    Record of a quantized image: filename, its mtime and size when quantized,
+    colour, and palette colours and their proportions, unused ones zeroed.
+    """
+    return np.dtype([
+        ('filename', f'S{filename_width}'),
+        ('mtime_ns', '<i8'),
+        ('size', '<i8'),
+        ('colour',) + COLOUR_DTYPE,
+        ('palette_colour', '<f4', (palette_size, 3)),
+        ('palette_weight', '<f4', (palette_size,))
+    ])
+
+
+
+def pad_palette(palette, palette_size):
+    """
+    Palette's colours and proportions as palette_size rows, zeroed past its own.
+    """
+    colours, weights = np.zeros((palette_size, 3), dtype=np.float32), np.zeros(palette_size, dtype=np.float32)
+    if palette is not None:
+        count = min(len(palette[1]), palette_size)
+        if count:
+            colours[:count] = np.asarray(palette[0], dtype=np.float32)[:count]
+            weights[:count] = palette[1][:count]
+
+    return colours, weights
+
+
+
+def save_cache(path, entries):
+    """
+    Write quantize cache, {filename: ((mtime_ns, size), colour, palette)}, to .npy.
+    Palette is ([colour, ...], [proportion, ...]), or None.
+    """
+    palette_size = max([len(palette[1]) for key, colour, palette in entries.values() if palette], default=1)
+    rows = [(filename.encode('utf-8'), mtime_ns, size, tuple(float(value) for value in colour))
+        + pad_palette(palette, palette_size)
+        for filename, ((mtime_ns, size), colour, palette) in sorted(entries.items())]
+    filename_width = max([len(row[0]) for row in rows], default=1)
+
+    cache = np.array(rows, dtype=get_cache_dtype(filename_width, palette_size))
+    write_replacing(path, lambda file: np.save(file, cache, allow_pickle=False))
+
+
+
+def load_cache(path):
+    """
+    Read quantize cache into {filename: ((mtime_ns, size), colour, palette)},
+    palette None if cache was written before palettes were kept.
+    """
+    cache = np.load(path, allow_pickle=False)
+    filenames = [filename.decode('utf-8') for filename in cache['filename'].tolist()]
+    keys = zip(cache['mtime_ns'].tolist(), cache['size'].tolist())
+    colours = map(tuple, cache['colour'].tolist())
+
+    # Palettes' proportions descend, unused slots zeroed at their end.
+    palettes = [None] * len(filenames)
+    if 'palette_weight' in cache.dtype.names:
+        palettes = []
+        for palette_colours, palette_weights in zip(cache['palette_colour'].tolist(), cache['palette_weight'].tolist()):
+            count = sum(weight > 0 for weight in palette_weights)
+            palettes.append((palette_colours[:count], palette_weights[:count]))
+
+    return {filename: (key, colour, palette) for filename, key, colour, palette in zip(filenames, keys, colours, palettes)}
+
+
+
+def save_palettes(path, palettes):
+    """
+    Write palettes, [(filename, [colour, ...], [proportion, ...]), ...], to .npz
+    of columns: filename, colour (float32, image x palette x 3) and weight
+    (uint8 percent of image, image x palette), unused palette slots zeroed.
+    """
+    palette_size = max([len(weights) for filename, colours, weights in palettes], default=1)
+    padded = [pad_palette((colours, weights), palette_size) for filename, colours, weights in palettes]
+    filenames = [filename.encode('utf-8') for filename, colours, weights in palettes]
+
+    columns = dict(
+        filename=np.array(filenames, dtype=f'S{max([len(filename) for filename in filenames], default=1)}'),
+        colour=np.array([colours for colours, weights in padded], dtype=np.float32).reshape(-1, palette_size, 3),
+        weight=np.array([np.around(weights * 100) for colours, weights in padded], dtype=np.uint8).reshape(-1, palette_size)
+    )
+    write_replacing(path, lambda file: np.savez(file, **columns))
+
+
+
+def load_palettes(path):
+    """
+    Read palettes file into {'filename': ..., 'colour': ..., 'weight': ...} columns.
+    """
+    with np.load(path, allow_pickle=False) as palettes:
+        return {column: palettes[column] for column in ['filename', 'colour', 'weight']}
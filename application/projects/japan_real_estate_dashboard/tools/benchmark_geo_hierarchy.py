@@ -0,0 +1,101 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking dashboard menu drill-downs on a synthetic geo
+# hierarchy: per-click aggregations against in-memory GeoHierarchy lookups,
+# checking both return the same menu items.
+# Runs against a local mongod, never the Atlas cluster, as collections are
+# dropped and recreated:
+#   MONGODB_BENCH_URI=mongodb://localhost:27017/ python benchmark_geo_hierarchy.py
+#------------------------------------------------------------------------------
+
+from os import environ
+from pymongo import MongoClient
+from geo_hierarchy import GeoHierarchy, get_menu_pipeline
+import random, time
+
+MONGODB_BENCH_URI = environ.get('MONGODB_BENCH_URI', 'mongodb://localhost:27017/')
+REPEATS = 5
+
+# Roughly the size of Japan's: 8 regions, 47 prefectures, ~1700 cities.
+REGION_COUNT = 8
+PREFECTURES_PER_REGION = 6
+CITIES_PER_PREFECTURE = 36
+DISTRICTS_PER_CITY = 12
+
+
+def create_geo_hierarchy(seed=5):
+    """
+    Build a geo_hierarchy doc: arrays of regions, prefectures, cities and
+    districts, each item pointing to its parent with 'partOf'.
+    """
+    rng = random.Random(seed)
+    hierarchy = {'_id': 'japan', 'regions': [], 'prefectures': [], 'cities': [], 'districts': []}
+    order = 0
+
+    for region in range(REGION_COUNT):
+        region_id = 'region_{0}'.format(region)
+        hierarchy['regions'].append({'_id': region_id, 'name': region_id.title()})
+
+        for prefecture in range(PREFECTURES_PER_REGION):
+            order += 1
+            prefecture_id = '{0}_prefecture_{1}'.format(region_id, prefecture)
+            hierarchy['prefectures'].append(
+                {'_id': prefecture_id, 'name': prefecture_id.title(), 'order': order, 'partOf': region_id})
+
+            for city in range(CITIES_PER_PREFECTURE):
+                city_id = '{0}_city_{1}'.format(prefecture_id, city)
+                hierarchy['cities'].append(
+                    {'_id': city_id, 'name': city_id.title(), 'count': rng.randint(1, 50000), 'partOf': prefecture_id})
+
+                for district in range(DISTRICTS_PER_CITY):
+                    district_id = '{0}_district_{1}'.format(city_id, district)
+                    hierarchy['districts'].append(
+                        {'_id': district_id, 'name': district_id.title(), 'count': rng.randint(1, 5000), 'partOf': city_id})
+
+    return hierarchy
+
+
+def time_call(function, *args):
+    """
+    Best of repeated calls, in milliseconds.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return min(timings), result
+
+
+def main():
+    """
+    Compare a drill-down of each menu level, aggregated and from memory.
+    """
+    client = MongoClient(MONGODB_BENCH_URI)
+    collection = client.fudousan_benchmark.geo_hierarchy
+    collection.drop()
+    collection.insert_one(create_geo_hierarchy())
+
+    load_ms, geo_hierarchy = time_call(lambda: GeoHierarchy(collection.find()))
+    print(">>> Geo hierarchy loaded in {0:.1f} ms: {1}".format(load_ms, geo_hierarchy.get_sizes()))
+
+    drill_downs = [
+        ('country', 'japan'),
+        ('regions', 'region_3'),
+        ('prefectures', 'region_3_prefecture_2'),
+        ('cities', 'region_3_prefecture_2_city_7')
+    ]
+
+    for keyword, parent in drill_downs:
+        aggregate_ms, aggregated = time_call(lambda: list(collection.aggregate(get_menu_pipeline(keyword, parent))))
+        lookup_ms, looked_up = time_call(geo_hierarchy.get_menu, keyword, parent)
+        status = 'OK' if aggregated == looked_up else 'MISMATCH'
+
+        print(">>> {0:<12} {1} items: aggregation {2:.3f} ms, lookup {3:.4f} ms [{4}]".format(
+            keyword, len(looked_up), aggregate_ms, lookup_ms, status))
+
+    client.drop_database('fudousan_benchmark')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#------------------------------------------------------------------------------
+# Script for checking the dashboard's batch endpoint against a running
+# server, eg. a dev server on a local mongod loaded with price data:
+# every key of a batch must equal its single /get-data response, and
+# unknown keys must be rejected.  Also times the batch against one
+# request per key.
+#   CHECK_URL=http://localhost:5000 CHECK_KEYS=2010_2020:stFrame-100_150,2010_2020:stFrame-150_200 python check_batch_endpoint.py
+#------------------------------------------------------------------------------
+
+from os import environ
+import requests, time
+
+CHECK_URL = environ.get('CHECK_URL', 'http://localhost:5000')
+CHECK_LANG = environ.get('CHECK_LANG', 'en')
+CHECK_KEYS = environ.get('CHECK_KEYS', '2010_2020:stFrame-100_150,2010_2020:stFrame-150_200').split(',')
+ENDPOINT = CHECK_URL + '/projects/japan-real-estate-dashboard-2010-2020/'
+
+
+def get_singles(session):
+    """
+    One /get-data request per key.
+    """
+    singles = {}
+    for key in CHECK_KEYS:
+        collection, _, options = key.partition(':')
+        params = {'lang': CHECK_LANG, 'collection': collection, 'options': options}
+        singles[key] = session.get(ENDPOINT + 'get-data', params=params).json()
+
+    return singles
+
+
+def get_batch(session, keys):
+    """
+    All keys in one /get-data-batch request.
+    """
+    params = {'lang': CHECK_LANG, 'keys': ','.join(keys)}
+
+    return session.get(ENDPOINT + 'get-data-batch', params=params)
+
+
+def main():
+    session = requests.Session()
+
+    start = time.perf_counter()
+    singles = get_singles(session)
+    singles_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    batch = get_batch(session, CHECK_KEYS).json()
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    for key in CHECK_KEYS:
+        status = 'OK' if batch.get(key) == singles[key] else 'MISMATCH'
+        print(">>> {0}: {1} docs [{2}]".format(key, len(singles[key]), status))
+
+    rejected = get_batch(session, CHECK_KEYS + ['no_such_collection:no_such_options'])
+    status = 'OK' if rejected.status_code == 400 else 'NOT REJECTED'
+    print(">>> Unknown key: {0} {1} [{2}]".format(rejected.status_code, rejected.json(), status))
+
+    print(">>> {0} keys: {1} requests {2:.1f} ms, batch {3:.1f} ms".format(
+        len(CHECK_KEYS), len(CHECK_KEYS), singles_ms, batch_ms))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+#-------------------------------------------------------------------
+#   Geo hierarchy of the dashboard menu, held in memory per language.
+#-------------------------------------------------------------------
+
+from pymongo import ReturnDocument
+
+# Menu levels: query keyword -> (child array in geo_hierarchy, projected fields, sort field, descending).
+MENU_LEVELS = {
+    'regions': ('prefectures', ['_id', 'name', 'order', 'partOf'], 'order', False),
+    'prefectures': ('cities', ['_id', 'name', 'count', 'partOf'], 'count', True),
+    'cities': ('districts', ['_id', 'name', 'count', 'partOf'], 'count', True)
+}
+
+# Menu levels whose children are parents in price stats too, besides regions
+# (cities' children, districts, parenting nothing).
+PARENT_LEVELS = ['regions', 'prefectures']
+
+# Separator of names in a stats parent path, as in price_stats.
+PATH_SEPARATOR = '/'
+
+
+def get_menu_pipeline(keyword, parent):
+    """
+    Aggregation answering a menu drill-down: every region for keyword 'country',
+    otherwise the children of parent, grouped and sorted.
+    """
+    if keyword == 'country':
+        return [
+            { '$unwind':
+                '$regions' },
+            { '$project':
+                { 'regions._id': 1, 'regions.name': 1 } }
+        ]
+
+    children, fields, sort_field, descending = MENU_LEVELS[keyword]
+
+    return [
+        { '$unwind':
+            '$' + children },
+        { '$match':
+            { children + '.partOf': parent } },
+        { '$group':
+            { '_id': '$' + children } },
+        { '$sort':
+            { '_id.' + sort_field: -1 if descending else 1 } },
+        { '$project':
+            { '_id.' + field: 1 for field in fields } }
+    ]
+
+
+
+def get_group_key(item):
+    """
+    Hashable key of a whole subdocument, for grouping duplicates like '$group' does.
+    """
+    return repr(sorted(item.items()))
+
+
+
+class GeoHierarchy(object):
+    """
+    Static geo_hierarchy docs loaded once into parent -> children lists,
+    children grouped, pre-sorted and projected like get_menu_pipeline()'s
+    output, so drill-downs are dictionary lookups instead of aggregations.
+    """
+
+    def __init__(self, docs):
+        self.regions = []
+        self.children = {keyword: {} for keyword in MENU_LEVELS}
+        self.parent_paths = {''}
+        self.build(docs)
+
+
+    def build(self, docs):
+        """
+        Project regions, and group each level's children under their parent.
+        """
+        seen = {keyword: set() for keyword in MENU_LEVELS}
+
+        for doc in docs:
+            for region in doc.get('regions', []):
+                self.regions.append({
+                    '_id': doc['_id'],
+                    'regions': {field: region[field] for field in ['_id', 'name'] if field in region}
+                })
+
+            for keyword, (children, fields, sort_field, descending) in MENU_LEVELS.items():
+                for child in doc.get(children, []):
+                    group_key = get_group_key(child)
+                    if group_key in seen[keyword]:
+                        continue
+                    seen[keyword].add(group_key)
+
+                    projected = {field: child[field] for field in fields if field in child}
+                    self.children[keyword].setdefault(child.get('partOf'), []).append({'_id': projected})
+
+        for keyword, (children, fields, sort_field, descending) in MENU_LEVELS.items():
+            for items in self.children[keyword].values():
+                items.sort(key=lambda item: item['_id'].get(sort_field, 0), reverse=descending)
+
+        self.build_parent_paths()
+
+
+    def build_parent_paths(self):
+        """
+        Paths of names, eg. 'Kanto/Tokyo', of every region, prefecture and city,
+        the parents price stats can be asked for.
+        """
+        paths = {}
+        for item in self.regions:
+            region = item['regions']
+            if 'name' in region:
+                paths[region.get('_id')] = region['name']
+
+        for keyword in PARENT_LEVELS:
+            child_paths = {}
+            for parent, items in self.children[keyword].items():
+                if parent not in paths:
+                    continue
+                for item in items:
+                    child = item['_id']
+                    if 'name' in child:
+                        child_paths[child.get('_id')] = paths[parent] + PATH_SEPARATOR + child['name']
+
+            self.parent_paths.update(paths.values())
+            paths = child_paths
+
+        self.parent_paths.update(paths.values())
+
+
+    def get_menu(self, keyword, parent):
+        """
+        Get menu items for a drill-down, same as aggregating get_menu_pipeline().
+        """
+        if keyword == 'country':
+            return self.regions
+
+        return self.children[keyword].get(parent, [])
+
+
+    def has_parent(self, path):
+        """
+        Whether path names a parent of price stats, '' being every region.
+        """
+        return path in self.parent_paths
+
+
+    def get_sizes(self):
+        """
+        Count of menu items held for each level.
+        """
+        sizes = {'regions': len(self.regions)}
+        for keyword, (children, fields, sort_field, descending) in MENU_LEVELS.items():
+            sizes[children] = sum(len(items) for items in self.children[keyword].values())
+        sizes['parentPaths'] = len(self.parent_paths)
+
+        return sizes
+
+
+
+def get_hierarchy_version(db):
+    """
+    Get version of language db's geo_hierarchy, bumped by reloads.
+    """
+    version_doc = db['cache_versions'].find_one({'_id': 'geo_hierarchy'})
+    if version_doc is None:
+        return 0
+
+    return version_doc['version']
+
+
+
+def bump_hierarchy_version(db):
+    """
+    Increment version of language db's geo_hierarchy, so that every
+    process serving the menu reloads it.  Returns the new version.
+    """
+    version_doc = db['cache_versions'].find_one_and_update(
+        {'_id': 'geo_hierarchy'},
+        {'$inc': {'version': 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+    return version_doc['version']
@@ -0,0 +1,77 @@
+#------------------------------------------------------------------------------
+# Script for load testing the dashboard's price data endpoint of a running
+# server with concurrent requests for a valid key and for invalid keys,
+# which the price data registry rejects before any MongoDB round trip.
+#   LOAD_TEST_URL=http://localhost:5000 python load_test_dashboard.py
+# Valid key to request can be set with LOAD_TEST_COLLECTION, LOAD_TEST_OPTIONS.
+#------------------------------------------------------------------------------
+
+from os import environ
+from concurrent.futures import ThreadPoolExecutor
+import requests, time
+
+LOAD_TEST_URL = environ.get('LOAD_TEST_URL', 'http://localhost:5000')
+ENDPOINT = '/projects/japan-real-estate-dashboard-2010-2020/get-data'
+VALID_PARAMS = {
+    'lang': 'en',
+    'collection': environ.get('LOAD_TEST_COLLECTION', '2010_2020'),
+    'options': environ.get('LOAD_TEST_OPTIONS', 'stFrame-100_150')
+}
+INVALID_PARAMS = [
+    {'lang': 'fr', 'collection': VALID_PARAMS['collection'], 'options': VALID_PARAMS['options']},
+    {'lang': 'en', 'collection': 'no_such_collection', 'options': VALID_PARAMS['options']},
+    {'lang': 'en', 'collection': VALID_PARAMS['collection'], 'options': '$where'},
+    {'lang': 'en', 'collection': 'price_slices', 'options': 'results'}
+]
+REQUEST_COUNT = 400
+CONCURRENCY = 8
+
+
+def timed_get(session, params):
+    """
+    Request once, returning status and latency in milliseconds.
+    """
+    start = time.perf_counter()
+    response = session.get(LOAD_TEST_URL + ENDPOINT, params=params)
+    response.content
+
+    return response.status_code, (time.perf_counter() - start) * 1000
+
+
+def run_load(params_list):
+    """
+    Cycle through params with concurrent requests, returning statuses and sorted latencies.
+    """
+    session = requests.Session()
+    params_cycle = [params_list[count % len(params_list)] for count in range(REQUEST_COUNT)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        results = list(executor.map(lambda params: timed_get(session, params), params_cycle))
+    elapsed = time.perf_counter() - start
+
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+
+    return statuses, sorted(latency for _, latency in results), elapsed
+
+
+def main():
+    """
+    Compare latency percentiles and throughput of valid and rejected requests.
+    """
+    # Warm up server's caches with the valid key.
+    requests.get(LOAD_TEST_URL + ENDPOINT, params=VALID_PARAMS)
+
+    for name, params_list in [('valid', [VALID_PARAMS]), ('invalid', INVALID_PARAMS)]:
+        statuses, latencies, elapsed = run_load(params_list)
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+
+        print(">>> {0:<8} {1} requests in {2:.2f} s ({3:.0f}/s), p50 {4:.1f} ms, p99 {5:.1f} ms, statuses {6}".format(
+            name, len(latencies), elapsed, len(latencies) / elapsed, p50, p99, statuses))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#-------------------------------------------------------------------
+#   Price data slices of the dashboard, materialized per options.
+#-------------------------------------------------------------------
+
+# Collections of materialized slices and of their stats, in each language's db.
+SLICES_COLLECTION = 'price_slices'
+STATS_COLLECTION = 'price_stats'
+
+# Collections of each language's db not holding price data.
+NON_DATA_COLLECTIONS = ['geo_hierarchy', 'cache_versions', SLICES_COLLECTION, STATS_COLLECTION]
+
+
+def get_slice_id(collection_name, options):
+    """
+    Key of a materialized slice, its '_id' in price_slices.
+    """
+    return '{0}:{1}'.format(collection_name, options)
+
+
+
+def get_stats_id(slice_id, parent_path):
+    """
+    Key of stats of a parent's children, its '_id' in price_stats.
+    """
+    return '{0}|{1}'.format(slice_id, parent_path)
+
+
+
+def get_price_data_pipeline(options):
+    """
+    Aggregation of the regions tree under options path, of every doc holding it.
+    """
+    return [
+        { '$match':
+            { options :
+                { '$type': 'object' } } },
+        { '$project':
+            { 'regions': '$' + options + '.regions' } }
+    ]
+
+
+
+def find_option_paths(doc, prefix=''):
+    """
+    Dotted paths of every subdocument of doc holding a 'regions' tree.
+    """
+    option_paths = []
+
+    for key, val in doc.items():
+        if not isinstance(val, dict):
+            continue
+        path = prefix + key
+        if 'regions' in val:
+            option_paths.append(path)
+        else:
+            option_paths.extend(find_option_paths(val, path + '.'))
+
+    return option_paths
+
+
+
+def get_fields_pipeline(prefix):
+    """
+    Aggregation of names of subdocument fields under dotted prefix ('' for
+    top level) of every doc, and whether each holds a 'regions' tree.
+    Only names leave MongoDB, never the trees.
+    """
+    if prefix:
+        match = { prefix[:-1] : { '$type': 'object' } }
+        subdocument = '$' + prefix[:-1]
+    else:
+        match = {}
+        subdocument = '$$ROOT'
+
+    return [
+        { '$match': match },
+        { '$project':
+            { '_id': 0, 'fields': { '$objectToArray': subdocument } } },
+        { '$unwind': '$fields' },
+        { '$match':
+            { 'fields.v': { '$type': 'object' } } },
+        { '$group':
+            { '_id': '$fields.k',
+              'has_regions':
+                { '$max':
+                    { '$ne': [ { '$type': '$fields.v.regions' }, 'missing' ] } } } },
+        { '$sort': { '_id': 1 } }
+    ]
+
+
+
+def get_option_paths(collection):
+    """
+    Options paths of every doc of a price data collection, sorted by level and name.
+    Walked a level at a time by field name aggregations, rather than reading
+    every doc with its regions trees.
+    """
+    option_paths = []
+    prefixes = ['']
+
+    while prefixes:
+        next_prefixes = []
+        for prefix in prefixes:
+            for field in collection.aggregate(get_fields_pipeline(prefix)):
+                path = prefix + field['_id']
+                if field['has_regions']:
+                    option_paths.append(path)
+                else:
+                    next_prefixes.append(path + '.')
+        prefixes = next_prefixes
+
+    return option_paths
+
+
+
+def get_data_collections(db):
+    """
+    Names of price data collections of a language's db.
+    """
+    return sorted([name for name in db.list_collection_names() if name not in NON_DATA_COLLECTIONS])
@@ -0,0 +1,131 @@
+#-------------------------------------------------------------------
+#   Summary statistics of price data slices, computed with pandas.
+#-------------------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+# Children key of each level of a regions tree.
+CHILD_LEVELS = {
+    'regions': 'prefectures',
+    'prefectures': 'cities',
+    'cities': 'districts',
+    'districts': None
+}
+
+# Separator of names in a node's path, eg. 'Kanto/Tokyo/Shinjuku'.
+PATH_SEPARATOR = '/'
+
+
+def flatten_regions_tree(regions):
+    """
+    Flatten a regions tree into one row per node and year:
+    node path, parent path, name, level, year, count and price mean.
+    """
+    rows = []
+    nodes = [('', 'regions', regions)]
+
+    while nodes:
+        parent_path, level, children = nodes.pop()
+
+        for name, node in children.items():
+            path = parent_path + PATH_SEPARATOR + name if parent_path else name
+
+            for year, year_data in node.get('transactYear', {}).items():
+                rows.append((path, parent_path, name, level, int(year),
+                    year_data.get('count'), year_data.get('priceMean')))
+
+            child_level = CHILD_LEVELS[level]
+            if child_level and child_level in node:
+                nodes.append((path, child_level, node[child_level]))
+
+    columns = ['path', 'parentPath', 'name', 'level', 'year', 'count', 'priceMean']
+    frame = pd.DataFrame(rows, columns=columns)
+    frame['count'] = pd.to_numeric(frame['count'], errors='coerce').astype(float)
+    frame['priceMean'] = pd.to_numeric(frame['priceMean'], errors='coerce').astype(float)
+
+    return frame
+
+
+
+def to_list(values, as_int=False):
+    """
+    Array to JSON-ready list, NaN as None.
+    """
+    return [to_value(value, as_int) for value in values.tolist()]
+
+
+
+def to_value(value, as_int=False):
+    """
+    Scalar to JSON-ready value, NaN as None.
+    """
+    value = float(value)
+    if np.isnan(value):
+        return None
+    return int(value) if as_int else value
+
+
+
+def compute_price_stats(regions):
+    """
+    Stats of every node of a regions tree, grouped by parent path:
+        count           total transactions over all years,
+        priceMean       count-weighted mean of yearly price means,
+        priceMedian     median of yearly price means,
+        years, counts, priceMeans
+                        yearly series, ascending,
+        countChange, priceChange
+                        year-over-year fractional change, None where
+                        the previous year is missing.
+    Returns {parent path: [stats of each child, by count descending]}.
+    """
+    frame = flatten_regions_tree(regions)
+    if len(frame) == 0:
+        return {}
+
+    frame = frame.sort_values(['path', 'year']).reset_index(drop=True)
+
+    # Year-over-year changes, only between consecutive years.
+    by_path = frame.groupby('path', sort=False)
+    is_consecutive = (frame['year'] - by_path['year'].shift(1)) == 1
+    for column, change_column in [('count', 'countChange'), ('priceMean', 'priceChange')]:
+        previous = by_path[column].shift(1)
+        frame[change_column] = ((frame[column] - previous) / previous).where(is_consecutive)
+    frame = frame.replace([np.inf, -np.inf], np.nan)
+
+    # Totals, count-weighted mean and median per node.
+    frame['weightedPrice'] = frame['count'] * frame['priceMean']
+    frame['weightedCount'] = frame['count'].where(frame['priceMean'].notnull())
+    totals = frame.groupby('path', sort=False).agg(
+        parentPath=('parentPath', 'first'),
+        name=('name', 'first'),
+        level=('level', 'first'),
+        count=('count', 'sum'),
+        weightedPrice=('weightedPrice', 'sum'),
+        weightedCount=('weightedCount', 'sum'),
+        priceMedian=('priceMean', 'median')
+    )
+    totals['priceMean'] = totals['weightedPrice'] / totals['weightedCount'].replace(0, np.nan)
+    totals = totals.sort_values('count', ascending=False, kind='mergesort')
+
+    # Yearly series of each node.
+    series = {path: group for path, group in frame.groupby('path', sort=False)}
+
+    stats = {}
+    for path, total in totals.iterrows():
+        group = series[path]
+        stats.setdefault(total['parentPath'], []).append({
+            'name': total['name'],
+            'level': total['level'],
+            'count': to_value(total['count'], as_int=True),
+            'priceMean': to_value(total['priceMean']),
+            'priceMedian': to_value(total['priceMedian']),
+            'years': group['year'].tolist(),
+            'counts': to_list(group['count'].values, as_int=True),
+            'priceMeans': to_list(group['priceMean'].values),
+            'countChange': to_list(group['countChange'].values),
+            'priceChange': to_list(group['priceChange'].values)
+        })
+
+    return stats
@@ -0,0 +1,87 @@
+#-------------------------------------------------------------------
+#   Registry of valid price data keys of the dashboard.
+#-------------------------------------------------------------------
+
+from .price_slices import (
+    get_slice_id,
+    get_price_data_pipeline,
+    get_option_paths,
+    get_data_collections,
+    SLICES_COLLECTION,
+    STATS_COLLECTION
+)
+
+
+def prepare_entry(db, collection_name, options, is_materialized=True):
+    """
+    Prepare everything a request for key needs.  Keys known not to be
+    materialized skip the slice lookup, going straight to aggregation.
+    """
+    return {
+        'collection': db[collection_name],
+        'slices': db[SLICES_COLLECTION],
+        'stats': db[STATS_COLLECTION],
+        'slice_id': get_slice_id(collection_name, options),
+        'pipeline': get_price_data_pipeline(options),
+        'is_materialized': is_materialized
+    }
+
+
+
+class PriceDataRegistry(object):
+    """
+    Every valid (lang, collection, options) key of the price data endpoint,
+    with its collections, slice id and aggregation pipeline prepared once.
+    Requests for any other key are rejected before reaching MongoDB,
+    and never put user input into a collection name or field path.
+
+    Keys come from options paths of each collection's docs, marked as
+    materialized when a slice of theirs exists.  Slices too large to be
+    materialized are left out by the materializer, so slices alone don't
+    list every key.
+    """
+
+    def __init__(self, language_dbs):
+        self.language_dbs = language_dbs
+        self.entries = {}
+        self.is_built = False
+
+
+    def build(self):
+        """
+        Register keys of every data collection of each language's db,
+        replacing registered keys once all are prepared.
+        """
+        entries = {}
+
+        for language, db in self.language_dbs.items():
+            # Materialized keys, read from ids alone.
+            slice_ids = set()
+            for slice_doc in db[SLICES_COLLECTION].find({}, {'_id': 1}):
+                slice_ids.add(slice_doc['_id'])
+
+            for collection_name in get_data_collections(db):
+                for options in get_option_paths(db[collection_name]):
+                    is_materialized = get_slice_id(collection_name, options) in slice_ids
+                    entries[(language, collection_name, options)] = prepare_entry(db, collection_name, options, is_materialized)
+
+        self.entries = entries
+        self.is_built = True
+
+
+    def get(self, language, collection_name, options):
+        """
+        Get prepared entry of key, None if key is invalid.
+        """
+        return self.entries.get((language, collection_name, options))
+
+
+    def get_sizes(self):
+        """
+        Count of keys registered for each language.
+        """
+        sizes = {language: 0 for language in self.language_dbs}
+        for language, collection_name, options in self.entries:
+            sizes[language] += 1
+
+        return sizes
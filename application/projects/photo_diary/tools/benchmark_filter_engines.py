@@ -0,0 +1,225 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking filter engines on synthetic year collections,
+# checking they all return the same docs, and that 'match' strategy
+# queries are answered with index scans once indexes exist.
+# Exits non-zero if any check fails, after every collection size is run.
+# Runs against a local mongod, never the Atlas cluster, as collections are
+# dropped and recreated:
+#   MONGODB_BENCH_URI=mongodb://localhost:27017/ python benchmark_filter_engines.py
+#------------------------------------------------------------------------------
+
+from os import environ
+from bson.json_util import ObjectId
+from pymongo import MongoClient
+from mongodb_helpers import (
+    create_filter_indexes,
+    get_filter_pipeline,
+    DOC_FIELDS,
+    PIPELINE_STRATEGIES
+)
+from filter_index import FilterIndex
+import random, sys, time
+
+MONGODB_BENCH_URI = environ.get('MONGODB_BENCH_URI', 'mongodb://localhost:27017/')
+COLLECTION_SIZES = [1000, 10000, 100000]
+REPEATS = 5
+
+QUERY_FIELD = {
+    'month': 'date.month',
+    'format_medium': 'format.medium',
+    'format_type': 'format.type',
+    'film': 'film',
+    'camera': 'model',
+    'lens': 'lens',
+    'focal_length': 'focal_length_35mm',
+    'tags': 'tags'
+}
+
+# Filter combinations as parsed by photo_diary_data().
+QUERIES = [
+    {'month': 6},
+    {'format_medium': ['film']},
+    {'format_medium': ['digital'], 'focal_length': [24, 35]},
+    {'month': 3, 'camera': ['Lumix DMC-LX7', 'FM2'], 'tags': ['street']},
+    {'film': ['Portra 400', 'HP5'], 'lens': ['Nikkor 50mm f1.4'], 'tags': ['night', 'food']}
+]
+
+CAMERAS = [('Panasonic', 'Lumix DMC-LX7', 'digital', 'Micro43'), ('Nikon', 'FM2', 'film', '35mm'),
+    ('Mamiya', '7II', 'film', '120'), ('Fujifilm', 'X-T2', 'digital', 'APS-C')]
+LENSES = ['Leica DC Vario-Summilux f1.4-2.3 24-90mm ASPH', 'Nikkor 50mm f1.4', 'N 80mm f4', 'XF 23mm f2']
+FILMS = [None, 'Portra 400', 'HP5', 'Ektar 100']
+TAGS = ['street', 'night', 'food', 'sea', 'mountain', 'temple', 'train', 'snow', 'festival', 'cafe']
+
+
+def create_synthetic_docs(size, owner, seed=5):
+    """
+    Build docs following the photo diary's schema.
+    """
+    return list(iterate_synthetic_docs(size, owner, seed))
+
+
+def iterate_synthetic_docs(size, owner, seed=5):
+    """
+    Yields docs following the photo diary's schema, one at a time.
+    """
+    rng = random.Random(seed)
+
+    for count in range(size):
+        make, model, medium, format_type = rng.choice(CAMERAS)
+        yield {
+            '_id': ObjectId(),
+            'filename': 'synthetic_{0}.jpg'.format(count),
+            'date': {'taken': None, 'year': 2022, 'month': rng.randint(1, 12), 'day': rng.randint(1, 28), 'time': None},
+            'make': make,
+            'model': model,
+            'lens': rng.choice(LENSES),
+            'focal_length_35mm': rng.choice([24, 28, 35, 50, 80, 90]),
+            'format': {'medium': medium, 'type': format_type},
+            'film': rng.choice(FILMS) if medium == 'film' else None,
+            'iso': rng.choice([100, 200, 400, 800]),
+            'aperture': rng.choice([1.4, 2.0, 2.8, 4.0]),
+            'shutter_speed': [1, rng.choice([60, 125, 250, 500])],
+            'gps': {'lat': rng.uniform(31, 43), 'lat_ref': 'N', 'lng': rng.uniform(130, 145), 'lng_ref': 'E'},
+            'tags': rng.sample(TAGS, rng.randint(0, 4)),
+            'url': 'https://storage.googleapis.com/synthetic/{0}.jpg'.format(count),
+            'url_thumb': 'https://storage.googleapis.com/synthetic/thumbs/{0}.jpg'.format(count),
+            'title': None,
+            'description': None,
+            'owner': owner
+        }
+
+
+def query_aggregate(collection, owner, queries, strategy):
+    """
+    Aggregation pipeline of photo_diary_data() for strategy.
+    """
+    pipeline = get_filter_pipeline(owner, queries, QUERY_FIELD, collection.name, strategy)
+
+    return list(collection.aggregate(pipeline))
+
+
+def compare_docs(reference_docs, docs):
+    """
+    Whether docs are the same set as reference, ignoring order and the 'isSubset' flag.
+    """
+    def as_comparable(doc):
+        return {field: doc.get(field) for field in DOC_FIELDS}
+
+    reference = sorted((as_comparable(doc) for doc in reference_docs), key=lambda doc: doc['_id'])
+    compared = sorted((as_comparable(doc) for doc in docs), key=lambda doc: doc['_id'])
+
+    return reference == compared
+
+
+def get_plan_stages(collection, pipeline):
+    """
+    Get names of every stage in the winning plan of an explained aggregation.
+    """
+    explain = collection.database.command('aggregate', collection.name, pipeline=pipeline, explain=True)
+    stages = []
+
+    def find_stages(item):
+        if isinstance(item, dict):
+            for key, val in item.items():
+                if key == 'rejectedPlans':
+                    continue
+                if key == 'stage':
+                    stages.append(val)
+                find_stages(val)
+        elif isinstance(item, list):
+            for val in item:
+                find_stages(val)
+
+    find_stages(explain)
+
+    return stages
+
+
+def time_call(function, *args):
+    """
+    Best of repeated calls, in milliseconds.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return min(timings), result
+
+
+def main():
+    """
+    Compare aggregation strategies and in-memory index for each collection size,
+    checking every engine returns the same docs as the 'documents' strategy.
+    """
+    client = MongoClient(MONGODB_BENCH_URI)
+    db = client.photo_diary_benchmark
+    owner = ObjectId()
+    failures = []
+
+    def check(passed, failure):
+        if not passed:
+            failures.append(failure)
+        return passed
+
+    for size in COLLECTION_SIZES:
+        collection = db[str(size)]
+        collection.drop()
+        collection.insert_many(create_synthetic_docs(size, owner))
+
+        start = time.perf_counter()
+        year_index = FilterIndex(collection.find({'owner': owner}), QUERY_FIELD)
+        build_ms = (time.perf_counter() - start) * 1000
+        print(">>> {0} docs, index loaded and built in {1:.1f} ms.".format(size, build_ms))
+
+        for queries in QUERIES:
+            print("    {0}:".format(queries))
+            reference_docs = None
+
+            for strategy in PIPELINE_STRATEGIES:
+                aggregate_ms, docs = time_call(query_aggregate, collection, owner, queries, strategy)
+                if reference_docs is None:
+                    reference_docs = docs
+                same = check(compare_docs(reference_docs, docs),
+                    "{0} docs, {1}: {2} docs differ".format(size, queries, strategy))
+                print("        {0:<10} {1:>9.3f} ms, {2} docs [{3}]".format(
+                    strategy, aggregate_ms, len(docs), 'OK' if same else 'MISMATCH'))
+
+            index_ms, docs = time_call(year_index.query, queries)
+            same = check(compare_docs(reference_docs, docs),
+                "{0} docs, {1}: index docs differ".format(size, queries))
+            print("        {0:<10} {1:>9.3f} ms, {2} docs [{3}]".format(
+                'index', index_ms, len(docs), 'OK' if same else 'MISMATCH'))
+
+        # Rerun 'match' strategy with filter indexes in place.
+        create_filter_indexes(collection)
+        print(">>> {0} docs, with filter indexes.".format(size))
+
+        for queries in QUERIES:
+            reference_docs = query_aggregate(collection, owner, queries, 'documents')
+            match_ms, docs = time_call(query_aggregate, collection, owner, queries, 'match')
+
+            pipeline = get_filter_pipeline(owner, queries, QUERY_FIELD, collection.name, 'match')
+            same = check(compare_docs(reference_docs, docs),
+                "{0} docs, {1}: indexed match docs differ".format(size, queries))
+            indexed = check('IXSCAN' in get_plan_stages(collection, pipeline),
+                "{0} docs, {1}: match not answered with an index scan".format(size, queries))
+
+            print("    {0}:".format(queries))
+            print("        {0:<10} {1:>9.3f} ms, {2} docs [{3}, {4}]".format(
+                'match', match_ms, len(docs), 'OK' if same else 'MISMATCH', 'IXSCAN' if indexed else 'NO IXSCAN'))
+
+        collection.drop()
+
+    client.drop_database('photo_diary_benchmark')
+
+    if failures:
+        print(">>> {0} checks failed:".format(len(failures)))
+        for failure in failures:
+            print("    " + failure)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
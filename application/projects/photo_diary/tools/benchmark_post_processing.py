@@ -0,0 +1,92 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking get-data post-processing of synthetic docs:
+# per-doc helper loops against single-pass NumPy columns (DocColumns).
+#   python benchmark_post_processing.py
+#------------------------------------------------------------------------------
+
+from bson.json_util import ObjectId
+from mongodb_helpers import (
+    get_image_counts,
+    get_filtered_selectables,
+    build_geojson_collection,
+    get_bounding_box,
+    DocColumns
+)
+from benchmark_filter_engines import create_synthetic_docs
+import time
+
+DOC_COUNTS = [10000, 50000, 200000]
+REPEATS = 3
+
+
+def process_with_helpers(docs):
+    """
+    Current post-processing, one loop per helper.
+    """
+    return (
+        get_image_counts(docs),
+        get_filtered_selectables(docs),
+        build_geojson_collection(docs),
+        get_bounding_box(docs)
+    )
+
+
+def process_with_columns(docs):
+    """
+    Post-processing from columns extracted in a single pass.
+    """
+    columns = DocColumns(docs)
+
+    return (
+        columns.get_image_counts(),
+        columns.get_selectables(),
+        columns.build_geojson_collection(),
+        columns.get_bounding_box()
+    )
+
+
+def is_identical(helpers_output, columns_output):
+    """
+    Compare outputs, ignoring order of unique selectables.
+    """
+    def sort_selectables(selectables):
+        return {key: sorted(values, key=str) for key, values in selectables.items()}
+
+    counter_a, selectables_a, features_a, bounds_a = helpers_output
+    counter_b, selectables_b, features_b, bounds_b = columns_output
+
+    return (counter_a == counter_b and features_a == features_b and bounds_a == bounds_b
+        and sort_selectables(selectables_a) == sort_selectables(selectables_b))
+
+
+def time_call(function, docs):
+    """
+    Best of repeated calls, in milliseconds.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function(docs)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return min(timings), result
+
+
+def main():
+    """
+    Compare both post-processing paths for each doc count.
+    """
+    owner = ObjectId()
+
+    for doc_count in DOC_COUNTS:
+        docs = create_synthetic_docs(doc_count, owner)
+        helpers_ms, helpers_output = time_call(process_with_helpers, docs)
+        columns_ms, columns_output = time_call(process_with_columns, docs)
+        status = 'OK' if is_identical(helpers_output, columns_output) else 'MISMATCH'
+
+        print(">>> {0} docs: helpers {1:.1f} ms, columns {2:.1f} ms, {3:.1f}x [{4}]".format(
+            doc_count, helpers_ms, columns_ms, helpers_ms / columns_ms, status))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking get-data response formats on synthetic years:
+# encoded size and jsonify() time of the full (docs + geojson features)
+# format against the compact (docs + flat coordinates) format.
+#   python benchmark_response_format.py
+#------------------------------------------------------------------------------
+
+from flask import Flask, jsonify
+from bson.json_util import ObjectId
+from mongodb_helpers import (
+    get_compact_results,
+    DocColumns
+)
+from benchmark_filter_engines import create_synthetic_docs
+import json, time
+
+DOC_COUNTS = [500, 5000, 50000]
+REPEATS = 3
+
+
+# JSON encoder for ObjectId type, as in photo diary routes.
+class MongoEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, ObjectId):
+            return str(obj)
+        return super(MongoEncoder, self).default(obj)
+
+
+def get_full_results(docs):
+    """
+    Default get-data results for docs.
+    """
+    columns = DocColumns(docs)
+
+    return {
+        'years': ['2022'],
+        'counter': columns.get_image_counts(),
+        'filterSelectables': [columns.get_selectables()],
+        'filteredSelectables': [],
+        'docs': docs,
+        'featureCollection': columns.build_geojson_collection(),
+        'bounds': columns.get_bounding_box()
+    }
+
+
+def time_jsonify(app, results):
+    """
+    Best of repeated jsonify() calls in milliseconds, with encoded size in bytes.
+    """
+    timings = []
+    with app.app_context():
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            response = jsonify(results)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    return min(timings), len(response.get_data())
+
+
+def main():
+    """
+    Compare both formats for each doc count.
+    """
+    app = Flask(__name__)
+    app.json_encoder = MongoEncoder
+    owner = ObjectId()
+
+    for doc_count in DOC_COUNTS:
+        full_results = get_full_results(create_synthetic_docs(doc_count, owner))
+        compact_results = get_compact_results(full_results)
+
+        full_ms, full_bytes = time_jsonify(app, full_results)
+        compact_ms, compact_bytes = time_jsonify(app, compact_results)
+
+        print(">>> {0} docs: full {1:.1f} KB in {2:.1f} ms, compact {3:.1f} KB in {4:.1f} ms ({5:.0%} of bytes)".format(
+            doc_count, full_bytes / 1024, full_ms, compact_bytes / 1024, compact_ms, compact_bytes / full_bytes))
+
+
+if __name__ == '__main__':
+    main()
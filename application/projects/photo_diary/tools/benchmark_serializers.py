@@ -0,0 +1,94 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking JSON serialization of real-shaped payloads
+# (photo diary docs, real estate regions trees): jsonify() with the
+# MongoDB-aware stdlib encoder against json_response() with orjson.
+# Run from the project root, where the app's config and .env live:
+#   python application/projects/photo_diary/tools/benchmark_serializers.py
+#------------------------------------------------------------------------------
+
+from pathlib import Path
+import sys
+sys.path.append(str(Path.cwd()))
+
+from flask import Flask, jsonify, json
+from bson.json_util import ObjectId
+from application import serializers
+from benchmark_filter_engines import create_synthetic_docs
+import random, time
+
+DOC_COUNTS = [500, 5000, 50000]
+REPEATS = 5
+
+
+def create_regions_tree(seed=5):
+    """
+    Build a price data doc following the real estate dashboard's regions tree:
+    regions > prefectures > cities > districts, each with yearly count and price mean.
+    """
+    rng = random.Random(seed)
+
+    def transact_years():
+        return {
+            str(year): {'count': rng.randint(1, 500), 'priceMean': rng.uniform(1e6, 1e8)}
+            for year in range(2010, 2021)
+        }
+
+    regions = {}
+    for region in range(8):
+        prefectures = {}
+        for prefecture in range(6):
+            cities = {}
+            for city in range(20):
+                districts = {
+                    'district_{0}'.format(district): {'transactYear': transact_years()}
+                    for district in range(10)
+                }
+                cities['city_{0}'.format(city)] = {'transactYear': transact_years(), 'districts': districts}
+            prefectures['prefecture_{0}'.format(prefecture)] = {'transactYear': transact_years(), 'cities': cities}
+        regions['region_{0}'.format(region)] = {'transactYear': transact_years(), 'prefectures': prefectures}
+
+    return [{'_id': ObjectId(), 'regions': regions}]
+
+
+def time_response(app, respond, payload):
+    """
+    Best of repeated responses in milliseconds, with the response body.
+    """
+    timings = []
+    with app.app_context():
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            body = respond(payload).get_data()
+            timings.append((time.perf_counter() - start) * 1000)
+
+    return min(timings), body
+
+
+def main():
+    """
+    Compare serializers on each payload, checking they decode to the same data.
+    """
+    app = Flask(__name__)
+    serializers.init_app(app)
+    owner = ObjectId()
+
+    payloads = [('{0} photo docs'.format(count), create_synthetic_docs(count, owner)) for count in DOC_COUNTS]
+    payloads.append(('regions tree', create_regions_tree()))
+
+    for name, payload in payloads:
+        jsonify_ms, jsonify_body = time_response(app, jsonify, payload)
+
+        app.config['JSON_SERIALIZER'] = 'stdlib'
+        stdlib_ms, stdlib_body = time_response(app, serializers.json_response, payload)
+        app.config['JSON_SERIALIZER'] = 'orjson'
+        orjson_ms, orjson_body = time_response(app, serializers.json_response, payload)
+
+        reference = json.loads(jsonify_body)
+        status = 'OK' if json.loads(stdlib_body) == reference == json.loads(orjson_body) else 'MISMATCH'
+
+        print(">>> {0}, {1:.1f} KB: jsonify {2:.1f} ms, stdlib {3:.1f} ms, orjson {4:.1f} ms, {5:.1f}x [{6}]".format(
+            name, len(jsonify_body) / 1024, jsonify_ms, stdlib_ms, orjson_ms, jsonify_ms / orjson_ms, status))
+
+
+if __name__ == '__main__':
+    main()
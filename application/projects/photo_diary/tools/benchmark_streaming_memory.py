@@ -0,0 +1,156 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking peak memory of get-data responses, materialized
+# (list, results dict, then one JSON body) against streamed as the route
+# streams with each filter engine: 'index' from the year's filter index,
+# pipeline strategies from an aggregation cursor.  The query matches every
+# doc, so results grow with the collection.
+# Each run is a fresh subprocess so its peak RSS is its own.
+# Runs against a local mongod, never the Atlas cluster, as collections are
+# dropped and recreated:
+#   MONGODB_BENCH_URI=mongodb://localhost:27017/ python benchmark_streaming_memory.py
+#------------------------------------------------------------------------------
+
+from os import environ
+from bson.json_util import ObjectId
+from pymongo import MongoClient
+from mongodb_helpers import (
+    find_docs,
+    get_selectables_pipeline,
+    stream_data_results,
+    DocColumns
+)
+from filter_index import FilterIndex
+from benchmark_filter_engines import iterate_synthetic_docs, QUERY_FIELD
+import json, resource, subprocess, sys
+
+MONGODB_BENCH_URI = environ.get('MONGODB_BENCH_URI', 'mongodb://localhost:27017/')
+DOC_COUNTS = [5000, 20000, 80000]
+BATCH_SIZE = 500
+INSERT_BATCH = 5000
+STREAM_ENGINES = ['index', 'match', 'documents', 'ids']
+
+# Matches every synthetic doc, as a filtered query.
+QUERIES = {'format_medium': ['digital', 'film']}
+
+
+def dumps(obj):
+    return json.dumps(obj, default=str)
+
+
+def respond_materialized(collection, owner):
+    """
+    Whole response built in memory, as photo_diary_data() does by default.
+    """
+    docs = list(find_docs(collection, owner, QUERIES, QUERY_FIELD, 'match'))
+    columns = DocColumns(docs)
+    results = {
+        'years': [collection.name],
+        'counter': columns.get_image_counts(),
+        'filterSelectables': [],
+        'filteredSelectables': columns.get_selectables(),
+        'docs': docs,
+        'featureCollection': columns.build_geojson_collection(),
+        'bounds': columns.get_bounding_box()
+    }
+    body = dumps(results)
+
+    return len(body)
+
+
+def respond_streamed(collection, owner, engine):
+    """
+    Response written chunk by chunk, as stream_results() does with ?stream=true.
+    """
+    if engine == 'index':
+        year_index = FilterIndex(collection.find({'owner': owner}), QUERY_FIELD)
+        docs = year_index.query(QUERIES)
+        filter_selectables = [DocColumns(year_index.docs).get_selectables()]
+    else:
+        docs = find_docs(collection, owner, QUERIES, QUERY_FIELD, engine, batch_size=BATCH_SIZE)
+        filter_selectables = list(collection.aggregate(get_selectables_pipeline(owner)))
+    envelope = {'years': [collection.name], 'filterSelectables': filter_selectables}
+
+    body_size = 0
+    for chunk in stream_data_results(envelope, docs, True, dumps, BATCH_SIZE):
+        body_size += len(chunk)
+
+    return body_size
+
+
+def run_child(mode, collection_name, owner):
+    """
+    Respond once in this process, printing body size and peak RSS.
+    Mode 'baseline' only connects, for the cost of interpreter and imports.
+    """
+    client = MongoClient(MONGODB_BENCH_URI)
+    collection = client.photo_diary_benchmark[collection_name]
+    owner = ObjectId(owner)
+
+    body_size = 0
+    if mode.startswith('stream-'):
+        body_size = respond_streamed(collection, owner, mode[len('stream-'):])
+    elif mode == 'materialize':
+        body_size = respond_materialized(collection, owner)
+
+    # Linux reports ru_maxrss in kilobytes.
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({'body_size': body_size, 'peak_mb': peak_mb}))
+
+
+def measure(mode, collection_name, owner):
+    """
+    Run a single response in a subprocess.
+    """
+    output = subprocess.run(
+        [sys.executable, __file__, mode, collection_name, str(owner)],
+        capture_output=True, text=True, check=True
+    ).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    """
+    Compare peak RSS of both modes for each doc count.
+    """
+    client = MongoClient(MONGODB_BENCH_URI)
+    db = client.photo_diary_benchmark
+    owner = ObjectId()
+
+    # Baseline: interpreter and imports only.
+    baseline_mb = measure('baseline', 'baseline', owner)['peak_mb']
+    print(">>> Baseline peak RSS {0:.1f} MB.".format(baseline_mb))
+
+    for doc_count in DOC_COUNTS:
+        collection = db[str(doc_count)]
+        collection.drop()
+
+        # Insert in batches, the benchmark itself not holding all docs.
+        batch = []
+        for doc in iterate_synthetic_docs(doc_count, owner):
+            batch.append(doc)
+            if len(batch) == INSERT_BATCH:
+                collection.insert_many(batch)
+                batch = []
+        if batch:
+            collection.insert_many(batch)
+
+        materialized = measure('materialize', collection.name, owner)
+        print(">>> {0} docs: materialized {1:.1f} MB peak RSS, {2:.1f} MB body.".format(
+            doc_count, materialized['peak_mb'], materialized['body_size'] / 1024 / 1024))
+
+        for engine in STREAM_ENGINES:
+            streamed = measure('stream-' + engine, collection.name, owner)
+            print(">>>     streamed ({0}) {1:.1f} MB peak RSS, {2:.1f} MB body.".format(
+                engine, streamed['peak_mb'], streamed['body_size'] / 1024 / 1024))
+
+        collection.drop()
+
+    client.drop_database('photo_diary_benchmark')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4:
+        run_child(*sys.argv[1:])
+    else:
+        main()
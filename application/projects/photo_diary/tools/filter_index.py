@@ -0,0 +1,181 @@
+#------------------------------------------------------------
+#   In-memory filter index for a year collection's documents.
+#------------------------------------------------------------
+
+def get_field_value(doc, target_field):
+    """
+    Get value at a dotted field path, None if missing.
+    """
+    value = doc
+    for key in target_field.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+
+    return value
+
+
+
+def iterate_bits(bitmap):
+    """
+    Yields positions of set bits, in ascending order.
+    """
+    # Least significant bit first.
+    bits = bin(bitmap)[:1:-1]
+    position = bits.find('1')
+    while position != -1:
+        yield position
+        position = bits.find('1', position + 1)
+
+
+
+def build_bitmap(positions, size):
+    """
+    Build bitmap from list of positions in a single pass.
+    """
+    bits = bytearray(size // 8 + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+
+    return int.from_bytes(bits, 'little')
+
+
+
+class FilterIndex(object):
+    """
+    Year collection's docs loaded once, with a bitmap of doc positions
+    for every value of each filterable field.  Bitmaps are plain ints,
+    so filters are answered with bitwise OR/AND instead of aggregations.
+
+    Follows the semantics of get_facet_pipeline():
+        'month' matches on equality,
+        'tags' matches docs sharing exactly one tag with the query,
+        the rest match docs whose value is in the query.
+    """
+
+    def __init__(self, docs, query_field):
+        self.query_field = query_field
+        self.docs = []
+        self.positions = {}
+        self.bitmaps = {keyword: {} for keyword in query_field}
+        self.all_docs = 0
+        self.build(docs)
+
+
+    def build(self, docs):
+        """
+        Index all docs, collecting positions per value before building bitmaps.
+        """
+        positions = {keyword: {} for keyword in self.query_field}
+
+        for doc in docs:
+            position = len(self.docs)
+            self.docs.append(doc)
+            self.positions[doc['_id']] = position
+
+            for keyword, target_field in self.query_field.items():
+                for value in self.get_values(doc, target_field):
+                    positions[keyword].setdefault(value, []).append(position)
+
+        size = len(self.docs)
+        self.all_docs = (1 << size) - 1
+        for keyword, value_positions in positions.items():
+            for value, doc_positions in value_positions.items():
+                self.bitmaps[keyword][value] = build_bitmap(doc_positions, size)
+
+
+    def add(self, doc):
+        """
+        Appends doc to index.
+        """
+        position = len(self.docs)
+        self.docs.append(doc)
+        self.positions[doc['_id']] = position
+        self.all_docs |= 1 << position
+        self.set_bits(doc, position)
+
+
+    def update(self, doc):
+        """
+        Replaces indexed doc with its updated version, in place.
+        """
+        position = self.positions.get(doc['_id'])
+        if position is None:
+            self.add(doc)
+            return
+
+        self.clear_bits(self.docs[position], position)
+        self.docs[position] = doc
+        self.set_bits(doc, position)
+
+
+    def set_bits(self, doc, position):
+        """
+        Flags doc's position in bitmaps of each of its field values.
+        """
+        bit = 1 << position
+        for keyword, target_field in self.query_field.items():
+            for value in self.get_values(doc, target_field):
+                bitmaps = self.bitmaps[keyword]
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+
+
+    def clear_bits(self, doc, position):
+        """
+        Unflags doc's position in bitmaps of each of its field values.
+        """
+        bit = 1 << position
+        for keyword, target_field in self.query_field.items():
+            for value in self.get_values(doc, target_field):
+                bitmaps = self.bitmaps[keyword]
+                bitmaps[value] = bitmaps.get(value, 0) & ~bit
+
+
+    def get_values(self, doc, target_field):
+        """
+        Get hashable values of field, tags being the only array field.
+        """
+        value = get_field_value(doc, target_field)
+        if target_field == 'tags':
+            return set(value or [])
+        if isinstance(value, (list, dict)):
+            return []
+        return [value]
+
+
+    def match(self, keyword, query):
+        """
+        Get bitmap of docs matching a single query.
+        """
+        bitmaps = self.bitmaps[keyword]
+
+        if self.query_field[keyword] == 'date.month':
+            return bitmaps.get(query, 0)
+
+        if self.query_field[keyword] == 'tags':
+            # Docs intersecting with exactly one queried tag.
+            seen_once, seen_more = 0, 0
+            for tag in set(query):
+                bitmap = bitmaps.get(tag, 0)
+                seen_more |= seen_once & bitmap
+                seen_once = (seen_once | bitmap) & ~seen_more
+            return seen_once
+
+        matched = 0
+        for value in query:
+            matched |= bitmaps.get(value, 0)
+        return matched
+
+
+    def query(self, queries):
+        """
+        Get docs matching every query, in collection order.
+        """
+        matched = self.all_docs
+        for keyword, query in queries.items():
+            matched &= self.match(keyword, query)
+            if not matched:
+                break
+
+        return [self.docs[position] for position in iterate_bits(matched)]
+
@@ -11,6 +11,7 @@ from decimal import *
 from PIL import Image, ExifTags
 from gps_unit_conversion import dms_to_deci_deg
 from image_metadata import Metadata
+from mongodb_helpers import bump_cache_versions
 from bson.json_util import ObjectId
 from pymongo import MongoClient
 from google.oauth2 import service_account
@@ -399,6 +400,9 @@ def create_mongodb_docs():
         collection.insert_many(mongodb_collections[year])
         print(">>> {0} documents inserted into {1} collection.".format(len(mongodb_collections[year]), year))
 
+        # Mark server's cached results for the year as stale.
+        bump_cache_versions(db, [year])
+
     print(">>> MongoDB database of uploaded images updated.")
 
 
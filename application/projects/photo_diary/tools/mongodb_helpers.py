@@ -2,21 +2,72 @@
 #   Helper scripts for MongoDB queries. 
 #---------------------------------------
 
+from pymongo import ReturnDocument
+import numpy as np
+import tempfile
+
+# Fields returned for each doc by filter pipelines.
+DOC_FIELDS = [
+    '_id', 'filename', 'date', 'make', 'model', 'lens', 'focal_length_35mm',
+    'format', 'film', 'iso', 'aperture', 'shutter_speed', 'gps', 'tags',
+    'url', 'url_thumb', 'title', 'description', 'owner'
+]
+
+# Month numbers to counter keys.
+MONTH_NAMES = {
+    1: 'jan', 2: 'feb', 3: 'mar', 4: 'apr',
+    5: 'may', 6: 'jun', 7: 'jul', 8: 'aug',
+    9: 'sep', 10: 'oct', 11: 'nov', 12: 'dec'
+}
+
+# Filter pipeline strategies:
+#   'documents' ->  facets carry whole docs, intersected as sets of docs.
+#   'ids'       ->  facets carry only '_id's, intersected docs looked up once at the end.
+#   'match'     ->  filters translated into a single $match, able to use indexes.
+PIPELINE_STRATEGIES = ['documents', 'ids', 'match']
+
+# Filter engines of get-data: in-memory 'index', one aggregation 'single', or a pipeline strategy.
+FILTER_ENGINES = ['index', 'single'] + PIPELINE_STRATEGIES
+
+# Former names of engines, still accepted.
+FILTER_ENGINE_ALIASES = {'aggregate': 'documents'}
+
+# Streamed get-data: features spooled in memory up to this size, then to a temporary file.
+FEATURE_SPOOL_BYTES = 1024 * 1024
+FEATURE_READ_BYTES = 64 * 1024
+
+# Compound indexes on year collections, backing 'match' strategy queries.
+FILTER_INDEXES = [
+    [('owner', 1), ('date.month', 1)],
+    [('owner', 1), ('format.medium', 1), ('format.type', 1)],
+    [('owner', 1), ('tags', 1)]
+]
+
+
+def get_filter_engine(name):
+    """
+    Filter engine of configured name, former names mapped to current ones.
+    Raises ValueError on unknown names, rather than failing on each filtered request.
+    """
+    engine = FILTER_ENGINE_ALIASES.get(name, name)
+    if engine not in FILTER_ENGINES:
+        raise ValueError("PHOTO_DIARY_FILTER_ENGINE must be one of {0}, not {1!r}.".format(
+            ', '.join(FILTER_ENGINES), name))
+
+    return engine
+
+
+
 def get_image_counts(docs):
     """
     Iterates through docs and counts occurances of each month,
     returning an object with image counts through the entire year.    
     """
     counter = {'all': 0}
-    month_num_map = {
-        '1': 'jan', '2': 'feb', '3': 'mar', '4': 'apr',
-        '5': 'may', '6': 'jun', '7': 'jul', '8': 'aug',
-        '9': 'sep', '10': 'oct', '11': 'nov', '12': 'dec'
-    }
 
     for doc in docs:
         month_num = doc['date']['month']
-        month_str = month_num_map[str(month_num)]
+        month_str = MONTH_NAMES[int(month_num)]
 
         try:
             count = counter[month_str]
@@ -29,12 +80,13 @@ def get_image_counts(docs):
 
 
 
-def get_facet_pipeline(query, target_field):
+def get_facet_pipeline(query, target_field, strategy='documents'):
     """
     Set up pipelines for aggregate method.
     Takes get requests from front-end and matches to documents' fields.
     'tags' is subtractive, where more tags in query will narrow results.
     'month' is equivalent, and the rest are additive where queries broaden results.
+    With 'ids' strategy, only '_id' of matching docs is kept.
     """
     # Operators will be different depending on target data field.
     if target_field == 'date.month':
@@ -80,30 +132,14 @@ def get_facet_pipeline(query, target_field):
             ]
         }
         
+    projection = {'_id': 1}
+    if strategy == 'documents':
+        projection = {field: 1 for field in DOC_FIELDS}
+    projection['isSubset'] = operator
+
     pipeline = [
         { 
-            '$project': {
-                '_id': 1,
-                'filename': 1,
-                'date': 1,
-                'make': 1,
-                'model': 1,
-                'lens': 1,
-                'focal_length_35mm': 1,
-                'format': 1,
-                'film': 1,
-                'iso': 1,
-                'aperture': 1,
-                'shutter_speed': 1,
-                'gps': 1,
-                'tags': 1,
-                'url': 1,
-                'url_thumb': 1,
-                'title': 1,
-                'description': 1,
-                'owner': 1,
-                'isSubset': operator
-            }
+            '$project': projection
         },
         {
             '$match': {
@@ -112,6 +148,13 @@ def get_facet_pipeline(query, target_field):
         }
     ]
 
+    if strategy == 'ids':
+        pipeline.append({
+            '$project': {
+                '_id': 1
+            }
+        })
+
     return pipeline
 
 
@@ -130,7 +173,7 @@ def create_match_stage(user_id):
 
 
 
-def create_facet_stage(queries, query_field):
+def create_facet_stage(queries, query_field, strategy='documents'):
     """
     Build individual facet stage for each query to be used in aggregate method.
     """
@@ -142,16 +185,17 @@ def create_facet_stage(queries, query_field):
     for keyword, query in queries.items():
         key = 'get_' + query_field[keyword].replace('.', '_')
         facet_stage['$facet'].update({
-            key: get_facet_pipeline(query, query_field[keyword])
+            key: get_facet_pipeline(query, query_field[keyword], strategy)
         })
 
     return facet_stage
 
 
 
-def create_projection_stage(facet_stage):
+def create_projection_stage(facet_stage, strategy='documents'):
     """
     Build projection stage to only return intersecting results between all facets.
+    With 'ids' strategy, intersects arrays of '_id's instead of whole docs.
     """
     # Build projection stage.
     projection_stage = {
@@ -163,22 +207,158 @@ def create_projection_stage(facet_stage):
     }
 
     for facet in facet_stage['$facet'].keys():
+        facet_field = '$' + facet
+        if strategy == 'ids':
+            facet_field = facet_field + '._id'
+
         projection_stage['$project']['intersect']['$setIntersection'].append(
-            '$' + facet
+            facet_field
         )
 
     return projection_stage
 
 
 
+def create_lookup_stages(collection_name):
+    """
+    Build stages fetching each intersected '_id' doc from collection, projected once.
+    """
+    lookup_stages = [
+        {
+            '$unwind': '$intersect'
+        },
+        {
+            '$lookup': {
+                'from': collection_name,
+                'localField': 'intersect',
+                'foreignField': '_id',
+                'as': 'doc'
+            }
+        },
+        {
+            '$unwind': '$doc'
+        },
+        {
+            '$replaceRoot': {
+                'newRoot': '$doc'
+            }
+        },
+        {
+            '$project': {field: 1 for field in DOC_FIELDS}
+        }
+    ]
+
+    return lookup_stages
+
+
+
+def get_filter_query(user_id, queries, query_field):
+    """
+    Translate queries into a plain query document, with the same semantics as
+    get_facet_pipeline(): month on equality, '$in' for additive fields, and
+    tags on intersection.  Facets keep docs sharing exactly one queried tag,
+    so multi-tag queries add an '$expr' check on top of the indexable '$in'.
+    """
+    filter_query = {
+        'owner': user_id
+    }
+
+    for keyword, query in queries.items():
+        target_field = query_field[keyword]
+
+        if target_field == 'date.month':
+            filter_query[target_field] = query
+        elif target_field == 'tags':
+            tags = sorted(set(query))
+            filter_query[target_field] = {'$in': tags}
+            if len(tags) > 1:
+                filter_query['$expr'] = {
+                    '$eq': [
+                        {
+                            '$size': {
+                                '$setIntersection': [
+                                    tags,
+                                    { '$ifNull': ['$' + target_field, []] }
+                                ]
+                            }
+                        },
+                        1
+                    ]
+                }
+        else:
+            filter_query[target_field] = {'$in': query}
+
+    return filter_query
+
+
+
+def create_filter_indexes(collection):
+    """
+    Create compound indexes used by filter queries, if not existing.
+    """
+    index_names = []
+    for keys in FILTER_INDEXES:
+        index_names.append(collection.create_index(keys))
+
+    return index_names
+
+
+
+def get_filter_pipeline(user_id, queries, query_field, collection_name, strategy='documents'):
+    """
+    Build complete filter pipeline for strategy, returning a stream of matching docs.
+    """
+    if strategy == 'match':
+        return [
+            {
+                '$match': get_filter_query(user_id, queries, query_field)
+            },
+            {
+                '$project': {field: 1 for field in DOC_FIELDS}
+            }
+        ]
+
+    match_stage = create_match_stage(user_id)
+    facet_stage = create_facet_stage(queries, query_field, strategy)
+    projection_stage = create_projection_stage(facet_stage, strategy)
+    pipeline = [match_stage, facet_stage, projection_stage]
+
+    if strategy == 'ids':
+        pipeline.extend(create_lookup_stages(collection_name))
+    else:
+        pipeline.extend([
+            {
+                '$unwind': '$intersect'
+            },
+            {
+                '$replaceRoot': {
+                    'newRoot': '$intersect'
+                }
+            }
+        ])
+
+    return pipeline
+
+
+
 def get_selectables_pipeline(user_id):
     """
     Set up pipeline to get all unique selectables for filter component.
     Group stage adds fields (except for 'tags') to their sets, while
     project stage collates all unique tags into 'tags' array.
     """
-    pipeline = [
-        create_match_stage(user_id),
+    pipeline = [create_match_stage(user_id)]
+    pipeline.extend(create_selectables_stages())
+
+    return pipeline
+
+
+
+def create_selectables_stages():
+    """
+    Build group and project stages collating unique selectables of input docs.
+    """
+    selectables_stages = [
         {
             '$group': {
                 '_id': 0,
@@ -223,7 +403,7 @@ def get_selectables_pipeline(user_id):
         }
     ]
 
-    return pipeline
+    return selectables_stages
 
 
 
@@ -286,27 +466,36 @@ def build_geojson_collection(docs):
 
     # Build each doc into geojson schema.
     for doc in docs:
-        feature = {
-            "type": "Feature",
-            "geometry": {
-                "type": "Point",
-                "coordinates": [
-                    float(doc['gps']['lng']),
-                    float(doc['gps']['lat'])
-                ]
-            },
-            "properties": {
-                "doc_id": doc['_id'],
-                "name": doc['filename'],
-                "date": {
-                    "year": doc['date']['year'],
-                    "month": doc['date']['month']
-                }
+        feature_collection["features"].append(build_geojson_feature(doc))
+
+    return feature_collection
+
+
+
+def build_geojson_feature(doc):
+    """
+    Build geojson feature of a single doc.
+    """
+    feature = {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [
+                float(doc['gps']['lng']),
+                float(doc['gps']['lat'])
+            ]
+        },
+        "properties": {
+            "doc_id": doc['_id'],
+            "name": doc['filename'],
+            "date": {
+                "year": doc['date']['year'],
+                "month": doc['date']['month']
             }
         }
-        feature_collection["features"].append(feature)
+    }
 
-    return feature_collection
+    return feature
 
 
 
@@ -336,4 +525,395 @@ def get_bounding_box(docs):
         ]
     }
 
-    return bounding_box
\ No newline at end of file
+    return bounding_box
+
+
+def get_cache_key(user_id, year, queries):
+    """
+    Build hashable key for caching results of a request.
+    Multi-value queries are deduplicated and sorted, so that
+    'film+digital' and 'digital+film' share the same entry.
+    """
+    canonical_queries = []
+
+    for keyword in sorted(queries):
+        query = queries[keyword]
+        if isinstance(query, list):
+            query = '+'.join(sorted(set(str(item) for item in query)))
+        canonical_queries.append((keyword, str(query)))
+
+    return (str(user_id), str(year), tuple(canonical_queries))
+
+
+
+def get_cache_versions(db):
+    """
+    Get versions of each year collection, bumped on every write.
+    """
+    versions = {}
+
+    for doc in db['cache_versions'].find({}):
+        versions[doc['_id']] = doc['version']
+
+    return versions
+
+
+
+def bump_cache_versions(db, years):
+    """
+    Increment versions of written year collections,
+    marking results cached from them as stale.
+    Returns the new versions.
+    """
+    versions = {}
+
+    for year in years:
+        version_doc = db['cache_versions'].find_one_and_update(
+            {'_id': str(year)},
+            {'$inc': {'version': 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        versions[version_doc['_id']] = version_doc['version']
+
+    return versions
+
+
+
+def get_data_pipeline(user_id, queries, query_field):
+    """
+    Build single aggregation returning everything get-data needs in one round trip:
+    filtered docs, selectables of the whole year and of filtered docs,
+    per-month counts and coordinate bounds.
+    As with 'documents' strategy, results share one 16MB output document,
+    so it's only used for filtered requests, year-only ones using a cursor.
+    """
+    filter_stages = []
+    if len(queries) != 0:
+        filter_stages.append({
+            '$match': get_filter_query(user_id, queries, query_field)
+        })
+
+    facet_stage = {
+        '$facet': {
+            'docs': filter_stages + [
+                {
+                    '$project': {field: 1 for field in DOC_FIELDS}
+                }
+            ],
+            'counts': filter_stages + [
+                {
+                    '$group': {
+                        '_id': '$date.month',
+                        'count': { '$sum': 1 }
+                    }
+                }
+            ],
+            'bounds': filter_stages + [
+                {
+                    '$group': {
+                        '_id': 0,
+                        'lngMin': { '$min': '$gps.lng' },
+                        'lngMax': { '$max': '$gps.lng' },
+                        'latMin': { '$min': '$gps.lat' },
+                        'latMax': { '$max': '$gps.lat' }
+                    }
+                }
+            ],
+            'filterSelectables': create_selectables_stages()
+        }
+    }
+
+    if len(queries) != 0:
+        facet_stage['$facet']['filteredSelectables'] = filter_stages + create_selectables_stages()
+
+    pipeline = [
+        create_match_stage(user_id),
+        facet_stage
+    ]
+
+    return pipeline
+
+
+
+def format_data_results(data, has_queries):
+    """
+    Format output of get_data_pipeline() into get-data results.
+    """
+    # Image counts for each month.
+    counter = {'all': 0}
+    for month_count in sorted(data['counts'], key=lambda month_count: month_count['_id']):
+        counter[MONTH_NAMES[int(month_count['_id'])]] = month_count['count']
+        counter['all'] = counter['all'] + month_count['count']
+
+    # Bounding box, none for empty results.
+    bounding_box = None
+    if len(data['bounds']) != 0:
+        bounds = data['bounds'][0]
+        bounding_box = {
+            'lng': [float(bounds['lngMin']), float(bounds['lngMax'])],
+            'lat': [float(bounds['latMin']), float(bounds['latMax'])]
+        }
+
+    filtered_selectables = []
+    if has_queries:
+        filtered_selectables = get_filtered_selectables([])
+        if len(data['filteredSelectables']) != 0:
+            filtered_selectables = data['filteredSelectables'][0]
+
+    results = {
+        'counter': counter,
+        'filterSelectables': data['filterSelectables'],
+        'filteredSelectables': filtered_selectables,
+        'docs': data['docs'],
+        'featureCollection': build_geojson_collection(data['docs']),
+        'bounds': bounding_box
+    }
+
+    return results
+
+
+
+def get_compact_results(results):
+    """
+    Compact format of get-data results, without geojson features repeating
+    each doc's id, filename and date.  Coordinates are packed as a flat
+    [lng, lat, lng, lat, ...] array, point i being the location of docs[i].
+    """
+    compact_results = {key: val for key, val in results.items() if key != 'featureCollection'}
+    compact_results['format'] = 'compact'
+    compact_results['coordinates'] = [
+        coordinate
+        for feature in results['featureCollection']['features']
+        for coordinate in feature['geometry']['coordinates']
+    ]
+
+    return compact_results
+
+
+
+class DocColumns(object):
+    """
+    Docs extracted in a single pass into NumPy columns, replacing separate
+    loops of get_image_counts(), get_filtered_selectables(),
+    build_geojson_collection() and get_bounding_box() with the same output.
+    Selectables are dictionary-encoded during the pass, so unique values
+    (tags included) are collected in linear time.
+    """
+
+    # Selectables keys and their doc values.
+    SELECTABLES = {
+        'formatMedium': lambda doc: doc['format']['medium'],
+        'formatType': lambda doc: doc['format']['type'],
+        'film': lambda doc: doc['film'],
+        'camera': lambda doc: doc['make'] + ' ' + doc['model'],
+        'lens': lambda doc: doc['lens'],
+        'focalLength': lambda doc: doc['focal_length_35mm']
+    }
+
+    def __init__(self, docs):
+        self.docs = docs
+        months, lngs, lats = [], [], []
+        self.categories = {key: {} for key in self.SELECTABLES}
+        self.categories['tags'] = {}
+
+        for doc in docs:
+            months.append(doc['date']['month'])
+            lngs.append(doc['gps']['lng'])
+            lats.append(doc['gps']['lat'])
+
+            for key, get_value in self.SELECTABLES.items():
+                self.categories[key].setdefault(get_value(doc), None)
+            for tag in doc['tags']:
+                self.categories['tags'].setdefault(tag, None)
+
+        self.months = np.array(months, dtype=np.int64)
+        self.lngs = np.array(lngs, dtype=np.float64)
+        self.lats = np.array(lats, dtype=np.float64)
+
+
+    def get_image_counts(self):
+        """
+        Counts of images through the entire year, per month.
+        """
+        counter = {'all': len(self.docs)}
+        month_counts = np.bincount(self.months, minlength=13)
+
+        for month_num in np.flatnonzero(month_counts):
+            counter[MONTH_NAMES[int(month_num)]] = int(month_counts[month_num])
+
+        return counter
+
+
+    def get_selectables(self):
+        """
+        Unique values of each selectable field.
+        """
+        return {key: list(values) for key, values in self.categories.items()}
+
+
+    def build_geojson_collection(self):
+        """
+        Build geojson collection for source in Mapbox.
+        """
+        coordinates = np.column_stack((self.lngs, self.lats)).tolist()
+        features = []
+
+        for doc, doc_coordinates in zip(self.docs, coordinates):
+            features.append({
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": doc_coordinates
+                },
+                "properties": {
+                    "doc_id": doc['_id'],
+                    "name": doc['filename'],
+                    "date": {
+                        "year": doc['date']['year'],
+                        "month": doc['date']['month']
+                    }
+                }
+            })
+
+        feature_collection = {
+            "type": "FeatureCollection",
+            "features": features
+        }
+
+        return feature_collection
+
+
+    def get_bounding_box(self):
+        """
+        Calculate bounding box for set of docs, none for empty docs.
+        """
+        if len(self.docs) == 0:
+            return None
+
+        bounding_box = {
+            'lng': [float(self.lngs.min()), float(self.lngs.max())],
+            'lat': [float(self.lats.min()), float(self.lats.max())]
+        }
+
+        return bounding_box
+
+
+
+class DocSummary(object):
+    """
+    Running month counts, selectables and bounds of docs added one at a time,
+    for streamed results where docs are never held in memory together.
+    """
+
+    def __init__(self):
+        self.counter = {'all': 0}
+        self.bounds = None
+        self.categories = {key: {} for key in DocColumns.SELECTABLES}
+        self.categories['tags'] = {}
+
+
+    def add(self, doc):
+        """
+        Add doc to counts, selectables and bounds.
+        """
+        month_str = MONTH_NAMES[int(doc['date']['month'])]
+        self.counter[month_str] = self.counter.get(month_str, 0) + 1
+        self.counter['all'] = self.counter['all'] + 1
+
+        for key, get_value in DocColumns.SELECTABLES.items():
+            self.categories[key].setdefault(get_value(doc), None)
+        for tag in doc['tags']:
+            self.categories['tags'].setdefault(tag, None)
+
+        lng, lat = float(doc['gps']['lng']), float(doc['gps']['lat'])
+        if self.bounds is None:
+            self.bounds = {'lng': [lng, lng], 'lat': [lat, lat]}
+        else:
+            self.bounds['lng'] = [min(self.bounds['lng'][0], lng), max(self.bounds['lng'][1], lng)]
+            self.bounds['lat'] = [min(self.bounds['lat'][0], lat), max(self.bounds['lat'][1], lat)]
+
+
+    def get_selectables(self):
+        """
+        Unique values of each selectable field.
+        """
+        return {key: list(values) for key, values in self.categories.items()}
+
+
+
+def find_docs(collection, user_id, queries, query_field, engine, batch_size=None):
+    """
+    Cursor of docs matching all filters, from MongoDB, with engine as pipeline
+    strategy.  'single' returns one results doc, not a stream of docs, so its
+    filters are run as the equivalent plain query instead.
+    """
+    cursor_options = {'batch_size': batch_size} if batch_size else {}
+
+    if len(queries) == 0:
+        # For query with just 'year'.
+        return collection.find({'owner': user_id}, **cursor_options)
+
+    if engine == 'single':
+        return collection.find(get_filter_query(user_id, queries, query_field), **cursor_options)
+
+    pipeline = get_filter_pipeline(user_id, queries, query_field, collection.name, engine)
+    if batch_size:
+        return collection.aggregate(pipeline, batchSize=batch_size)
+
+    return collection.aggregate(pipeline)
+
+
+
+def stream_data_results(envelope, docs, has_queries, dumps, chunk_size=500):
+    """
+    Yields get-data results as JSON in chunks, in a single pass over docs
+    (a cursor, or docs already in memory): envelope fields first, then docs
+    as they arrive, then geojson features built from them on the way, and
+    counts, selectables and bounds, only known after all docs, at the end.
+    Features are spooled as JSON until docs are written, in memory up to
+    FEATURE_SPOOL_BYTES and to a temporary file beyond, so memory held
+    doesn't grow with the number of docs.
+    """
+    summary = DocSummary()
+
+    with tempfile.SpooledTemporaryFile(max_size=FEATURE_SPOOL_BYTES, mode='w+', encoding='utf-8') as features:
+        # Docs, summarized and their features spooled as they pass,
+        # as comma-separated JSON array items, chunk_size at a time.
+        yield dumps(envelope)[:-1] + ', "docs": ['
+
+        chunk = []
+        chunk_separator = ''
+        feature_separator = ''
+        for doc in docs:
+            summary.add(doc)
+            features.write(feature_separator + dumps(build_geojson_feature(doc)))
+            feature_separator = ', '
+            chunk.append(dumps(doc))
+            if len(chunk) == chunk_size:
+                yield chunk_separator + ', '.join(chunk)
+                chunk = []
+                chunk_separator = ', '
+        if chunk:
+            yield chunk_separator + ', '.join(chunk)
+
+        yield '], "featureCollection": {"type": "FeatureCollection", "features": ['
+
+        features.seek(0)
+        feature_chunk = features.read(FEATURE_READ_BYTES)
+        while feature_chunk:
+            yield feature_chunk
+            feature_chunk = features.read(FEATURE_READ_BYTES)
+
+    yield ']}, '
+
+    filtered_selectables = []
+    if has_queries:
+        filtered_selectables = summary.get_selectables()
+
+    summary_fields = {
+        'counter': summary.counter,
+        'filteredSelectables': filtered_selectables,
+        'bounds': summary.bounds
+    }
+    yield dumps(summary_fields)[1:]
@@ -0,0 +1,116 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking the landing page's latest project lookup and the
+# projects page's ordering: every doc sorted in Python, as before, against
+# indexed sort + limit with projection.  Reports time per query and docs
+# examined, by number of projects.
+# Runs against a local mongod, never the Atlas cluster, as its collection
+# is dropped and recreated:
+#   MONGODB_BENCH_URI=mongodb://localhost:27017/ python benchmark_project_queries.py
+#------------------------------------------------------------------------------
+
+from os import environ
+from pymongo import MongoClient, DESCENDING
+import random, time
+
+MONGODB_BENCH_URI = environ.get('MONGODB_BENCH_URI', 'mongodb://localhost:27017/')
+PROJECT_COUNTS = [10, 100, 1000, 10000]
+REPEATS = 50
+
+
+def create_project_docs(count, seed=5):
+    """
+    Build project docs shaped like projectsIndex.main's, in random order.
+    """
+    rng = random.Random(seed)
+    project_ids = list(range(1, count + 1))
+    rng.shuffle(project_ids)
+
+    return [{
+        'project_id': project_id,
+        'title': f'Project {project_id}',
+        'year': 2015 + project_id % 8,
+        'description': ' '.join(rng.choice(['map', 'data', 'photo', 'web', 'site']) for i in range(120)),
+        'objectives': [f'Objective {i}' for i in range(5)],
+        'stack': {
+            'backend': [{'Flask': 'https://flask.palletsprojects.com'}, {'MongoDB': 'https://mongodb.com'}],
+            'frontend': [{'React': 'https://reactjs.org'}],
+            'tools': [{'NumPy': 'https://numpy.org'}]
+        },
+        'url': [{'en': f'/projects/{project_id}'}],
+        'git': 'https://github.com',
+        'thumb': f'https://storage/thumb_{project_id}.jpg',
+        'demo': f'https://storage/demo_{project_id}.mp4',
+        'rgb': '0, 171, 60'
+    } for project_id in project_ids]
+
+
+
+def latest_sorted_in_python(collection):
+    docs = list(collection.find({}))
+    return sorted(docs, key=lambda doc: doc['project_id'], reverse=True)[0]
+
+
+def latest_indexed(collection):
+    return collection.find_one({}, {'thumb': 1, 'demo': 1}, sort=[('project_id', DESCENDING)])
+
+
+def all_sorted_in_python(collection):
+    return sorted(list(collection.find({})), key=lambda doc: doc['project_id'], reverse=True)
+
+
+def all_indexed(collection):
+    return list(collection.find({}).sort('project_id', DESCENDING))
+
+
+
+def time_query(query, collection):
+    """
+    Mean ms of query over repeats.
+    """
+    start = time.perf_counter()
+    for repeat in range(REPEATS):
+        query(collection)
+
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+
+def get_docs_examined(collection):
+    """
+    Docs examined by latest project lookup.
+    """
+    cursor = collection.find({}, {'thumb': 1, 'demo': 1}).sort('project_id', DESCENDING).limit(1)
+
+    return cursor.explain()['executionStats']['totalDocsExamined']
+
+
+
+def main():
+    client = MongoClient(MONGODB_BENCH_URI)
+    collection = client.benchmark_projects['main']
+
+    print(f'{"projects":>9} {"index":>6} | {"latest: python":>15} {"indexed":>9} {"examined":>9} |'
+        f' {"all: python":>12} {"indexed":>9}')
+
+    for count in PROJECT_COUNTS:
+        collection.drop()
+        collection.insert_many(create_project_docs(count))
+
+        for indexed in [False, True]:
+            if indexed:
+                collection.create_index([('project_id', DESCENDING)])
+
+            latest_python = time_query(latest_sorted_in_python, collection)
+            latest_new = time_query(latest_indexed, collection)
+            all_python = time_query(all_sorted_in_python, collection)
+            all_new = time_query(all_indexed, collection)
+
+            print(f'{count:9} {str(indexed):>6} | {latest_python:12.2f} ms {latest_new:6.2f} ms'
+                f' {get_docs_examined(collection):9} | {all_python:9.2f} ms {all_new:6.2f} ms')
+
+    collection.drop()
+
+
+
+if __name__ == '__main__':
+    main()
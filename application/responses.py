@@ -0,0 +1,173 @@
+#------------------------------------------------------------
+# Conditional, compressed JSON responses for data routes.
+#------------------------------------------------------------
+
+from flask import current_app, request
+from .serializers import dumps_bytes
+import gzip, hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class CachedBody(object):
+    """
+    Serialized JSON body with its ETag, and compressed copies of it
+    made on first request for each encoding, so hot keys are only
+    compressed once.  Compressed copies count toward its size, reported
+    to on_resize (eg. its cache's resize()) as each is added.
+    """
+
+    def __init__(self, body, etag, on_resize=None):
+        self.body = body
+        self.etag = etag
+        self.encoded = {}
+        self.on_resize = on_resize
+
+
+    def get_size(self):
+        """
+        Returns bytes of body and its compressed copies.
+        """
+        return len(self.body) + sum(len(encoded) for encoded in list(self.encoded.values()))
+
+
+    def get_encoded(self, encoding):
+        """
+        Returns body compressed with encoding, compressing on first use.
+        """
+        encoded = self.encoded.get(encoding)
+        if encoded is None:
+            if encoding == 'br':
+                encoded = brotli.compress(self.body, quality=5)
+            else:
+                encoded = gzip.compress(self.body, compresslevel=6)
+            self.encoded[encoding] = encoded
+            if self.on_resize is not None:
+                self.on_resize(self, self.get_size())
+
+        return encoded
+
+
+
+def get_version_etag(*parts):
+    """
+    Builds ETag from what the response depends on, eg. a cache key and the
+    version of its collection, so it can be checked without querying data.
+    """
+    key = repr((current_app.config.get('APP_VERSION'),) + parts).encode('utf-8')
+
+    return hashlib.sha1(key).hexdigest()
+
+
+
+def get_content_etag(body):
+    """
+    Builds ETag from the body itself.
+    """
+    return hashlib.sha1(body).hexdigest()
+
+
+
+def choose_encoding(body_size):
+    """
+    Picks brotli or gzip if accepted by client, none for small bodies.
+    """
+    if body_size < current_app.config['RESPONSE_COMPRESS_MIN_BYTES']:
+        return None
+    if brotli is not None and request.accept_encodings['br']:
+        return 'br'
+    if request.accept_encodings['gzip']:
+        return 'gzip'
+
+    return None
+
+
+
+def not_modified(etag):
+    """
+    Empty 304 response, client's copy being current.
+    """
+    response = current_app.response_class(status=304)
+    response.set_etag(etag)
+    response.vary.add('Accept-Encoding')
+
+    return response
+
+
+
+def get_cached_body(cache, cache_key, get_results, etag=None, tag=None, is_cacheable=None):
+    """
+    Cached JSON body of results, building and caching it if missing, or if
+    cached under an etag other than the one given.  Results failing
+    is_cacheable, if given, are returned without being cached.
+    """
+    cached_body = cache.get(cache_key)
+    if cached_body is None or (etag is not None and cached_body.etag != etag):
+        results = get_results()
+        body = dumps_bytes(results)
+        cached_body = CachedBody(body, etag or get_content_etag(body),
+            on_resize=lambda value, size: cache.resize(cache_key, value, size))
+        if is_cacheable is None or is_cacheable(results):
+            cache.set(cache_key, cached_body, tag=tag, size=cached_body.get_size())
+
+    return cached_body
+
+
+
+def body_response(cached_body):
+    """
+    JSON response of body with its ETag, 304 if client's copy is current,
+    compressed when large to an encoding client accepts.
+    """
+    if cached_body.etag in request.if_none_match:
+        return not_modified(cached_body.etag)
+
+    encoding = choose_encoding(len(cached_body.body))
+    body = cached_body.body
+    if encoding is not None:
+        body = cached_body.get_encoded(encoding)
+
+    response = current_app.response_class(
+        body,
+        mimetype=current_app.config.get('JSONIFY_MIMETYPE') or 'application/json'
+    )
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    response.set_etag(cached_body.etag)
+    response.vary.add('Accept-Encoding')
+
+    return response
+
+
+
+def cached_json_response(cache, cache_key, get_results, etag=None, tag=None):
+    """
+    JSON response of results with ETag, answered from cached body if possible.
+
+    With an etag given (version based), a matching If-None-Match is answered
+    with 304 before results are built, and cached bodies of other versions
+    are rebuilt.  Without, the ETag is hashed from the body when first built,
+    and cached bodies are reused until evicted or invalidated by tag.
+    """
+    if etag is not None and etag in request.if_none_match:
+        return not_modified(etag)
+
+    cached_body = get_cached_body(cache, cache_key, get_results, etag=etag, tag=tag)
+
+    return body_response(cached_body)
+
+
+
+def keyed_json_response(cached_bodies):
+    """
+    JSON response of an object of already serialized bodies by key,
+    joined without decoding them, with ETag hashed from theirs.
+    """
+    items = [dumps_bytes(key) + b':' + cached_body.body for key, cached_body in cached_bodies.items()]
+    body = b'{' + b','.join(items) + b'}'
+    etag = get_version_etag(*[(key, cached_body.etag) for key, cached_body in cached_bodies.items()])
+
+    return body_response(CachedBody(body, etag))
@@ -0,0 +1,99 @@
+#------------------------------------------------------------
+# JSON serialization of MongoDB results for all routes.
+#------------------------------------------------------------
+
+from flask import current_app, json
+from bson.decimal128 import Decimal128
+from bson.json_util import ObjectId
+from datetime import date, datetime
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_default(obj):
+    """
+    Encodes types neither encoder handles on its own:
+        ObjectId as its hex string,
+        Decimal and Decimal128 as numbers,
+        dates and datetimes as ISO 8601 strings.
+    """
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Decimal128):
+        return float(obj.to_decimal())
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError("Object of type {0} is not JSON serializable".format(type(obj).__name__))
+
+
+
+class MongoJSONEncoder(json.JSONEncoder):
+    """
+    Standard library encoder with the same types as encode_default(),
+    used by jsonify() and whenever orjson isn't available.
+    """
+
+    def default(self, obj):
+        try:
+            return encode_default(obj)
+        except TypeError:
+            return super(MongoJSONEncoder, self).default(obj)
+
+
+
+def use_orjson():
+    """
+    Returns true if orjson is installed and not switched off in config.
+    """
+    return orjson is not None and current_app.config.get('JSON_SERIALIZER', 'orjson') == 'orjson'
+
+
+
+def dumps_bytes(obj, sort_keys=None):
+    """
+    Serializes obj to UTF-8 JSON bytes, sorting keys like jsonify() unless told otherwise.
+    """
+    if sort_keys is None:
+        sort_keys = current_app.config.get('JSON_SORT_KEYS', True)
+
+    if use_orjson():
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=encode_default, option=option)
+
+    return json.dumps(obj, cls=MongoJSONEncoder, sort_keys=sort_keys).encode('utf-8')
+
+
+
+def dumps(obj, sort_keys=None):
+    """
+    Serializes obj to a JSON string.
+    """
+    return dumps_bytes(obj, sort_keys).decode('utf-8')
+
+
+
+def json_response(obj, status=200):
+    """
+    Drop-in for jsonify(obj), serialized with orjson when available.
+    """
+    return current_app.response_class(
+        dumps_bytes(obj) + b'\n',
+        status=status,
+        mimetype=current_app.config.get('JSONIFY_MIMETYPE') or 'application/json'
+    )
+
+
+
+def init_app(app):
+    """
+    Use MongoDB-aware encoder for every jsonify() of the app.
+    """
+    app.json_encoder = MongoJSONEncoder
@@ -0,0 +1,127 @@
+(function handleMenuItems() {
+    /* ------------------------------------------------------------------
+        Changes menu targets to 'top' if currently viewing target page.
+    ------------------------------------------------------------------ */
+    const currentPath = window.location.pathname;
+    const aboutLink = document.getElementById("header_menu_list_item_about");
+    const projectsLink = document.getElementById("header_menu_list_item_projects");
+    const resumeLink = document.getElementById("header_menu_list_item_resume");
+
+
+    if (currentPath === '/' || currentPath === '/#index_about') {
+        aboutLink.setAttribute('onClick', 'window.location.href="/#index_about"');
+    } else if (currentPath === '/projects' || currentPath === '/projects#top') {
+        projectsLink.setAttribute('onClick', 'window.location.href="/projects#top"');
+    } else if (currentPath === '/resume/' || currentPath === '/resume#top') {
+        resumeLink.setAttribute('onClick', 'window.location.href="/resume#top"');
+    } 
+})();
+  
+  
+
+(function menuToggle() {
+    /* -------------------------------
+        Handles menu button toggles.
+    ------------------------------- */
+    const menu = document.getElementsByClassName("header_menu")[0];
+    const menuArrowToggle = document.getElementsByClassName("header_menu_toggle")[0];
+    const menuArrowStroke1 = document.getElementById("header_menu_toggle_stroke1");
+    const menuArrowStroke2 = document.getElementById("header_menu_toggle_stroke2");
+    const menuList = document.getElementById("header_menu_list");
+
+    menuArrowToggle.addEventListener('click', function() {
+        menu.classList.toggle("toggle");
+        menuArrowToggle.classList.toggle("toggle");
+        menuArrowStroke1.classList.toggle("toggle");
+        menuArrowStroke2.classList.toggle("toggle");
+        menuList.classList.toggle("toggle");
+    });
+})();
+
+
+
+(function blendToggleBackground() {
+    /* ------------------------------------------------------------
+        Blend menu toggle's background on resume menu item hover.
+    ------------------------------------------------------------ */
+    const resumeMenuItem = document.getElementById("header_menu_list_item_resume");
+    const menuArrowToggle = document.getElementsByClassName("header_menu_toggle")[0];
+
+    resumeMenuItem.addEventListener('mouseover', function() {
+        menuArrowToggle.classList.add("resume-hover");
+    });
+
+    resumeMenuItem.addEventListener('mouseout', function() {
+        menuArrowToggle.classList.remove("resume-hover");
+    });
+
+    // For touch devices.
+    resumeMenuItem.addEventListener('touchstart', function() {
+        menuArrowToggle.classList.add("resume-hover");
+    });
+
+    resumeMenuItem.addEventListener('touchend', function() {
+        menuArrowToggle.classList.remove("resume-hover");
+    });
+})();
+
+window.onload = function() {
+	/* ------------------------
+		Loader for main page.
+	------------------------ */
+	let picFrame = document.getElementsByClassName("Index__cityscape")[0];
+	let initPicFrameWidthPercent = getComputedStyle(picFrame).width;
+
+    parallaxScroll(initPicFrameWidthPercent);
+};
+
+
+function parallaxScroll(initPicFrameWidthPercent) {
+	/* --------------------------
+		Parallax scroll effect.
+	-------------------------- */
+	window.addEventListener("scroll", function(event) {
+		let container = document.getElementsByClassName("container")[0];
+		let scrollHeight = container.scrollHeight;
+		let orientation = (window.innerWidth > window.innerHeight) 
+			? 'landscape'
+			: 'portrait';
+		let picFrame = document.getElementsByClassName("Index__cityscape")[0];
+		let layers = document.getElementsByClassName("Index__cityscape__layers");
+		let layerDistance, layer, scrollDepth, scrollEffect;
+		let scrollDist = window.pageYOffset;
+		let scrollDistHeightRatio = scrollDist / scrollHeight; 
+		let zoom = Math.floor(initPicFrameWidthPercent.replace('%', ''));
+		
+
+		// Elevation parallax effect based on scroll distance.
+		for (var i = 0; i < layers.length; i++) {
+			layer = layers[i]
+			layerDistance = layer.getAttribute("data-distance");
+
+			if (scrollDistHeightRatio <= 0.4) {
+				if (orientation === 'landscape') {
+					scrollDepth = scrollDist * layerDistance * 0.20;
+				} 
+				else if (orientation === 'portrait') {
+					scrollDepth = scrollDist * layerDistance * 0.10;
+				}
+			}
+
+			// Shift layers' y-axis position.
+			scrollEffect = 'translateY('.concat(scrollDepth, 'px)');
+			layer.style.transform = scrollEffect;
+		}
+
+		// "Zoom" into frame if scrolled more than 150px.
+		if (scrollDist >= 150 
+			&& scrollDist < scrollHeight * 0.6) {
+
+			let newZoom = zoom + (scrollDist / scrollHeight * 25);
+			let widenPercent = Math.floor(newZoom).toString().concat('%');
+			picFrame.style.width = widenPercent;
+		} 
+		else
+			picFrame.style.width = initPicFrameWidthPercent;
+	});
+};
\ No newline at end of file
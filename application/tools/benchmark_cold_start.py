@@ -0,0 +1,102 @@
+#------------------------------------------------------------------------------
+# Script for benchmarking cold start, with blueprints registered eagerly
+# against lazily (LAZY_BLUEPRINTS).  For each mode, in fresh subprocesses:
+#   - import time report of create_app(), from python -X importtime,
+#     summed by top-level package,
+#   - time to create the app, then to first response of '/', then of
+#     each project page, which in lazy mode loads its blueprint.
+# '/' queries MongoDB, point MONGODB_URI at a reachable server, eg. a local one.
+# Run from the project root, where the app's config and .env live:
+#   MONGODB_URI=mongodb://localhost:27017/ python application/tools/benchmark_cold_start.py
+#------------------------------------------------------------------------------
+
+from pathlib import Path
+import sys
+sys.path.append(str(Path.cwd()))
+
+import json, subprocess, time
+
+MODES = {'eager': False, 'lazy': True}
+PROJECT_PAGES = [
+    '/projects/gallery',
+    '/projects/tokaido-urban-hike',
+    '/projects/japan-real-estate-dashboard-2010-2020',
+    '/projects/photo-diary/'
+]
+TOP_PACKAGES = 12
+REPEATS = 3
+
+IMPORT_APP = 'from application import create_app; app = create_app(lazy={0})'
+
+
+def get_import_times(lazy):
+    """
+    Import time of create_app() by top-level package, self times summed, in ms.
+    """
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_APP.format(lazy)],
+        capture_output=True, text=True, check=True
+    ).stderr
+
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        packages[package] = packages.get(package, 0) + int(self_us) / 1000
+
+    return packages
+
+
+
+def time_first_responses(lazy):
+    """
+    In this process: ms to create app, then to first response of '/'
+    and of each project page.  Prints results as JSON.
+    """
+    start = time.perf_counter()
+    from application import create_app
+    app = create_app(lazy=lazy)
+    timings = {'create_app': (time.perf_counter() - start) * 1000}
+
+    client = app.test_client()
+    for path in ['/'] + PROJECT_PAGES:
+        path_start = time.perf_counter()
+        status = client.get(path).status_code
+        timings[path] = (time.perf_counter() - path_start) * 1000
+        timings[path + ' status'] = status
+
+    print(json.dumps(timings))
+
+
+
+def main():
+    for mode, lazy in MODES.items():
+        packages = get_import_times(lazy)
+        total = sum(packages.values())
+        print(f'\n{mode}: imports {total:.0f} ms')
+        for package, ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:TOP_PACKAGES]:
+            print(f'  {package:28} {ms:8.1f} ms')
+
+        runs = []
+        for repeat in range(REPEATS):
+            output = subprocess.run(
+                [sys.executable, __file__, mode],
+                capture_output=True, text=True, check=True
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+
+        print(f'  first responses, best of {REPEATS}:')
+        for key in ['create_app', '/'] + PROJECT_PAGES:
+            best = min(run[key] for run in runs)
+            status = runs[0].get(key + ' status', '')
+            print(f'    {key:50} {best:8.1f} ms {status}')
+
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        time_first_responses(MODES[sys.argv[1]])
+    else:
+        main()
@@ -0,0 +1,155 @@
+#------------------------------------------------------------------------------
+# Script for measuring cold start and connection count of MongoDB access:
+# one client per blueprint, as before, against the shared application client.
+# Each mode runs in a fresh subprocess, timing client creation and the first
+# query on each blueprint's db (the cold start a first request pays), then
+# counting pool connections opened by concurrent queries (steady state).
+# Queries are reads only (find_one), so the URI may be the Atlas cluster,
+# where SRV lookups and TLS handshakes are part of the cold start.
+# Run from the project root, where the app's config and .env live:
+#   MONGODB_BENCH_URI=mongodb://localhost:27017/ python application/tools/benchmark_mongo_connections.py
+#------------------------------------------------------------------------------
+
+from pathlib import Path
+import sys
+sys.path.append(str(Path.cwd()))
+
+from os import environ
+from concurrent.futures import ThreadPoolExecutor
+from pymongo import MongoClient, monitoring
+import json, subprocess, threading, time
+
+MONGODB_BENCH_URI = environ.get('MONGODB_BENCH_URI', 'mongodb://localhost:27017/')
+
+# Blueprint -> db it queries.
+BLUEPRINT_DBS = [
+    ('index', 'projectsIndex'),
+    ('projects', 'projectsIndex'),
+    ('resume', 'resume'),
+    ('photo_diary', 'photo_diary'),
+    ('japan_real_estate_dashboard', 'fudousan_en')
+]
+QUERIES = 500
+WORKERS = 16
+
+
+class ConnectionCounter(monitoring.ConnectionPoolListener):
+    """
+    Counts pool connections opened and currently open, over every client.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.created = 0
+        self.current = 0
+        self.peak = 0
+
+    def connection_created(self, event):
+        with self.lock:
+            self.created += 1
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def connection_closed(self, event):
+        with self.lock:
+            self.current -= 1
+
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_check_out_started(self, event): pass
+    def connection_check_out_failed(self, event): pass
+    def connection_checked_out(self, event): pass
+    def connection_checked_in(self, event): pass
+
+
+
+def create_per_blueprint_dbs():
+    """
+    One MongoClient per blueprint, connecting at creation, as routes did.
+    """
+    return [MongoClient(MONGODB_BENCH_URI)[db_name] for blueprint, db_name in BLUEPRINT_DBS]
+
+
+
+def create_shared_dbs():
+    """
+    Every blueprint's db on the shared client, configured like create_app().
+    """
+    from flask import Flask
+    from config import Config
+    from application.database import MongoDatabase
+
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config['MONGODB_URI'] = MONGODB_BENCH_URI
+    mongo = MongoDatabase(app)
+
+    return [mongo.get_db(db_name) for blueprint, db_name in BLUEPRINT_DBS]
+
+
+
+def run_mode(mode):
+    """
+    Measure one mode in this process, prints results as JSON.
+    """
+    counter = ConnectionCounter()
+    monitoring.register(counter)
+
+    start = time.perf_counter()
+    dbs = create_per_blueprint_dbs() if mode == 'per-blueprint' else create_shared_dbs()
+    created_ms = (time.perf_counter() - start) * 1000
+
+    # First request of each blueprint.
+    first_query_ms = []
+    for db in dbs:
+        query_start = time.perf_counter()
+        db['benchmark'].find_one()
+        first_query_ms.append((time.perf_counter() - query_start) * 1000)
+    cold_start_ms = (time.perf_counter() - start) * 1000
+
+    # Steady state: concurrent requests spread over blueprints.
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        list(executor.map(lambda i: dbs[i % len(dbs)]['benchmark'].find_one(), range(QUERIES)))
+
+    clients = {id(db.client): db.client for db in dbs}
+    print(json.dumps({
+        'clients': len(clients),
+        'monitored_servers': sum(len(client.nodes) for client in clients.values()),
+        'created_ms': created_ms,
+        'first_query_ms': first_query_ms,
+        'cold_start_ms': cold_start_ms,
+        'connections_opened': counter.created,
+        'connections_peak': counter.peak,
+        'connections_open': counter.current
+    }))
+
+
+
+def main():
+    print(f'{QUERIES} queries over {len(BLUEPRINT_DBS)} blueprints, {WORKERS} threads, {MONGODB_BENCH_URI}')
+
+    for mode in ['per-blueprint', 'shared']:
+        output = subprocess.run(
+            [sys.executable, __file__, mode],
+            capture_output=True, text=True, check=True
+        ).stdout
+        results = json.loads(output.strip().splitlines()[-1])
+
+        print(f'\n{mode}')
+        print(f'  clients:             {results["clients"]} ({results["monitored_servers"]} monitored servers)')
+        print(f'  client creation:     {results["created_ms"]:8.1f} ms')
+        print(f'  first queries:       ' + ', '.join(f'{ms:.1f}' for ms in results['first_query_ms']) + ' ms')
+        print(f'  cold start total:    {results["cold_start_ms"]:8.1f} ms')
+        print(f'  pool connections:    {results["connections_opened"]} opened, '
+            f'{results["connections_peak"]} peak, {results["connections_open"]} open at steady state')
+
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run_mode(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,134 @@
+#------------------------------------------------------------
+# Warmup of a new instance, before it serves visitors.
+#------------------------------------------------------------
+
+from jinja2 import TemplateError
+from .database import mongo
+from .dispatch import LazyBlueprintDispatcher
+from .serializers import json_response
+import time
+
+
+def run_step(timings, name, step):
+    """
+    Time step, recording its result, or its error without stopping warmup.
+    """
+    start = time.perf_counter()
+    try:
+        detail, ok = step(), True
+    except Exception as error:
+        detail, ok = f'{type(error).__name__}: {error}', False
+
+    timings.append({
+        'step': name,
+        'ms': round((time.perf_counter() - start) * 1000, 1),
+        'ok': ok,
+        'detail': detail
+    })
+
+
+
+def get_apps(app):
+    """
+    App and apps of its lazily loaded blueprints, loaded so far.
+    """
+    if isinstance(app.wsgi_app, LazyBlueprintDispatcher):
+        return [app] + list(app.wsgi_app.apps.values())
+
+    return [app]
+
+
+
+def load_blueprints(app):
+    """
+    Load every lazily loaded blueprint, with its imports and startup loads.
+    """
+    if not isinstance(app.wsgi_app, LazyBlueprintDispatcher):
+        return 'registered on startup'
+
+    app.wsgi_app.load_all()
+
+    return f'{len(app.wsgi_app.apps)} loaded'
+
+
+
+def compile_templates(app):
+    """
+    Compile every HTML template of each app into its Jinja cache.
+    """
+    compiled, failed = 0, []
+    for each_app in get_apps(app):
+        jinja_env = each_app.jinja_env
+        for name in jinja_env.list_templates(extensions=['html']):
+            try:
+                jinja_env.get_template(name)
+                compiled += 1
+            except TemplateError:
+                failed.append(name)
+
+    return {'compiled': compiled, 'failed': failed}
+
+
+
+def request_path(app, path):
+    """
+    Request path within app, filling the caches it uses.
+    """
+    response = app.test_client().get(path)
+    if response.status_code >= 500:
+        raise RuntimeError(f'status {response.status_code}')
+
+    return response.status_code
+
+
+
+def run_warmup(app):
+    """
+    Open database connections, load blueprints, compile templates, then
+    request WARMUP_PATHS to load gallery data and prime data caches.
+    Returns timings of each step.
+    """
+    timings = []
+    run_step(timings, 'database', mongo.health_check)
+    run_step(timings, 'blueprints', lambda: load_blueprints(app))
+    run_step(timings, 'templates', lambda: compile_templates(app))
+    for path in app.config['WARMUP_PATHS']:
+        run_step(timings, path, lambda: request_path(app, path))
+
+    return timings
+
+
+
+def print_timings(timings):
+    """
+    Print table of warmup timings.
+    """
+    for timing in timings:
+        status = 'ok' if timing['ok'] else 'FAILED'
+        print(f"{timing['step']:70} {timing['ms']:9.1f} ms  {status}  {timing['detail']}")
+    print(f"{'total':70} {sum(timing['ms'] for timing in timings):9.1f} ms")
+
+
+
+def init_app(app):
+    """
+    Register warmup route, requested by App Engine when starting an instance,
+    and its CLI command:
+        flask warmup
+    """
+    def warmup():
+        '''
+        Warm up instance once, later requests get the same timings.
+        '''
+        if 'warmup' not in app.extensions:
+            app.extensions['warmup'] = run_warmup(app)
+            print_timings(app.extensions['warmup'])
+
+        return json_response({'timings': app.extensions['warmup']})
+
+    app.add_url_rule('/_ah/warmup', 'warmup', warmup, methods=['GET'])
+
+
+    @app.cli.command('warmup')
+    def warmup_command():
+        print_timings(run_warmup(app))
@@ -24,6 +24,39 @@ class Config:
     elif flask_debug_env.lower() in ('f', 'false', False, '0', 0, 'off'):
         FLASK_DEBUG = False
 
+    # Load project blueprints on first request under their URLs, instead of on startup.
+    # Their CLI commands need it off, eg. LAZY_BLUEPRINTS=false flask japan_real_estate_dashboard_bp reload-geo-hierarchy
+    LAZY_BLUEPRINTS = environ.get('LAZY_BLUEPRINTS', 'true').lower() in ('t', 'true', '1', 'on')
+
+    # Index, projects and resume pages served from memory, re-rendered when their
+    # content version is bumped: checked in background once older than FRESH seconds.
+    # Invalidated by POST /_admin/invalidate-pages with TOKEN, or: flask invalidate-pages
+    PAGE_CACHE_ENABLED = environ.get('PAGE_CACHE_ENABLED', str(not FLASK_DEBUG)).lower() in ('t', 'true', '1', 'on')
+    PAGE_CACHE_FRESH_SECONDS = int(environ.get('PAGE_CACHE_FRESH_SECONDS', 300))
+    PAGE_CACHE_TOKEN = environ.get('PAGE_CACHE_TOKEN')
+    PAGE_CACHE_INVALIDATE_URL = environ.get('PAGE_CACHE_INVALIDATE_URL', 'http://localhost:5000/_admin/invalidate-pages')
+
+    # Gallery page rendered once per swatches and captions files' version.
+    GALLERY_MEMOIZE_PAGE = environ.get('GALLERY_MEMOIZE_PAGE', str(not FLASK_DEBUG)).lower() in ('t', 'true', '1', 'on')
+
+    # Requested on warmup to prime page and data caches, comma separated.
+    WARMUP_PATHS = environ.get('WARMUP_PATHS', ','.join([
+        '/',
+        '/projects',
+        '/resume',
+        '/projects/gallery',
+        '/projects/photo-diary/get-data?year=default',
+        '/projects/japan-real-estate-dashboard-2010-2020/get-menu?lang=en&country=japan',
+        '/projects/japan-real-estate-dashboard-2010-2020/get-menu?lang=jp&country=japan'
+    ])).split(',')
+
+    # JSON serializer of Mongo-backed routes: 'orjson' when installed, or 'stdlib'.
+    JSON_SERIALIZER = environ.get('JSON_SERIALIZER', 'orjson')
+
+    # JSON data responses: ETags change with deployed version, bodies compressed above size.
+    APP_VERSION = environ.get('GAE_VERSION')
+    RESPONSE_COMPRESS_MIN_BYTES = int(environ.get('RESPONSE_COMPRESS_MIN_BYTES', 1024))
+
     # CORS origins
     CORS_ORIGIN_DEV =  environ.get('CORS_ORIGIN_DEV')
     CORS_ORIGIN_PRODUCTION = environ.get('CORS_ORIGIN_PRODUCTION')
@@ -37,6 +70,46 @@ class Config:
     # Database
     MONGODB_ID = environ.get('MONGODB_ID')
     MONGODB_KEY = environ.get('MONGODB_KEY')
+    MONGODB_HOST = environ.get('MONGODB_HOST', 'portfolio.8frim.mongodb.net')
+    # Full connection string, overrides ID/KEY/HOST when set.
+    MONGODB_URI = environ.get('MONGODB_URI')
+
+    # Shared MongoDB client: pool bounds, idle connection lifetime, and
+    # timeouts failing queries fast when the cluster is unreachable.
+    MONGODB_MAX_POOL_SIZE = int(environ.get('MONGODB_MAX_POOL_SIZE', 10))
+    MONGODB_MIN_POOL_SIZE = int(environ.get('MONGODB_MIN_POOL_SIZE', 0))
+    MONGODB_MAX_IDLE_MS = int(environ.get('MONGODB_MAX_IDLE_MS', 300000))
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(environ.get('MONGODB_SERVER_SELECTION_TIMEOUT_MS', 5000))
+    MONGODB_CONNECT_TIMEOUT_MS = int(environ.get('MONGODB_CONNECT_TIMEOUT_MS', 5000))
+    MONGODB_APP_NAME = environ.get('MONGODB_APP_NAME', 'jeanings.space')
+
+    # Photo diary result cache, bounded by count and total MB of bodies and their compressed copies.
+    PHOTO_DIARY_CACHE_SIZE = int(environ.get('PHOTO_DIARY_CACHE_SIZE', 128))
+    PHOTO_DIARY_CACHE_MB = int(environ.get('PHOTO_DIARY_CACHE_MB', 16))
+    PHOTO_DIARY_CACHE_TTL = int(environ.get('PHOTO_DIARY_CACHE_TTL', 600))
+    PHOTO_DIARY_CACHE_SYNC = int(environ.get('PHOTO_DIARY_CACHE_SYNC', 30))
+
+    # Photo diary filtering:
+    #   filter pipeline strategy 'documents' (formerly 'aggregate'), 'ids' or 'match',
+    #   'single' (one aggregation for all results of filtered requests),
+    #   or 'index' (in-memory), opt-in as it holds up to PHOTO_DIARY_INDEX_SIZE
+    #   years of docs in each instance.
+    #   Unknown values fail at startup.
+    PHOTO_DIARY_FILTER_ENGINE = environ.get('PHOTO_DIARY_FILTER_ENGINE', 'documents')
+    PHOTO_DIARY_INDEX_SIZE = int(environ.get('PHOTO_DIARY_INDEX_SIZE', 8))
+
+    # Photo diary streamed get-data (?stream=true), docs fetched per cursor batch.
+    PHOTO_DIARY_STREAM_BATCH = int(environ.get('PHOTO_DIARY_STREAM_BATCH', 500))
+
+    # Japan real estate dashboard response cache, bounded by count and total MB of bodies
+    # and their compressed copies, checking for geo hierarchy reloads every SYNC seconds.
+    DASHBOARD_CACHE_SIZE = int(environ.get('DASHBOARD_CACHE_SIZE', 256))
+    DASHBOARD_CACHE_MB = int(environ.get('DASHBOARD_CACHE_MB', 32))
+    DASHBOARD_CACHE_SYNC = int(environ.get('DASHBOARD_CACHE_SYNC', 60))
+
+    # Japan real estate dashboard batch get-data, keys per request and concurrent queries.
+    DASHBOARD_BATCH_MAX_KEYS = int(environ.get('DASHBOARD_BATCH_MAX_KEYS', 12))
+    DASHBOARD_BATCH_WORKERS = int(environ.get('DASHBOARD_BATCH_WORKERS', 4))
 
     # Mapbox
     MAPBOX_ACCESS_KEY = environ.get('MAPBOX_ACCESS_KEY')